@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Bulk dataset generator for MERN Memories
+Run: python generate_data.py --count 10000 [--target api|mongo|file]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from utils.api import API_URL, PostsApi
+from utils.datagen import (
+    DEFAULT_IMAGE_MIX, delete_via_mongo, generate_posts, load_via_api,
+    load_via_mongo, parse_image_mix
+)
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate and load synthetic memories")
+    parser.add_argument("--count", type=int, default=1000, help="Number of posts to generate")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed, same dataset)")
+    parser.add_argument(
+        "--images",
+        default=",".join(f"{size}:{weight}" for size, weight in DEFAULT_IMAGE_MIX.items()),
+        help="Image size mix as bytes:probability pairs, e.g. 0:0.5,20000:0.5"
+    )
+    parser.add_argument("--tag", default="bulk", help="Tag added to every generated post")
+    parser.add_argument("--target", choices=["api", "mongo", "file"], default="api")
+    parser.add_argument("--api-url", default=API_URL)
+    parser.add_argument("--mongo-uri", default=os.getenv("CONNECTION_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--database", default=os.getenv("MONGO_DB", "test"))
+    parser.add_argument("--output", default="bulk_posts.json", help="Output file for --target file")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--delete", action="store_true", help="Delete all posts carrying --tag instead")
+    return parser.parse_args()
+
+def main():
+    """Generate, then load or write, the dataset"""
+    options = parse_args()
+    start = time.perf_counter()
+    
+    if options.delete:
+        if options.target == "mongo":
+            deleted = delete_via_mongo(options.mongo_uri, options.database, options.tag)
+        else:
+            api = PostsApi(options.api_url, pool_size=options.concurrency)
+            deleted = api.delete_tagged(options.tag)
+        print(f"🧹 Deleted {deleted} posts tagged '{options.tag}' in {time.perf_counter() - start:.1f}s")
+        return 0
+    
+    posts = generate_posts(
+        options.count, seed=options.seed, tags=[options.tag],
+        image_mix=parse_image_mix(options.images)
+    )
+    
+    print(f"🌱 Generating {options.count} posts (seed {options.seed}) -> {options.target}")
+    if options.target == "api":
+        api = PostsApi(options.api_url, pool_size=options.concurrency)
+        loaded = len(load_via_api(api, posts, options.concurrency))
+    elif options.target == "mongo":
+        loaded = load_via_mongo(posts, options.mongo_uri, options.database, concurrency=options.concurrency)
+    else:
+        with open(options.output, "w") as f:
+            json.dump(list(posts), f)
+        loaded = options.count
+    
+    elapsed = time.perf_counter() - start
+    print(f"✅ Loaded {loaded} posts in {elapsed:.1f}s ({loaded / max(elapsed, 1e-9):.0f} posts/s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
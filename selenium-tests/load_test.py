@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+HTTP load generator for the MERN Memories posts API
+Run: python load_test.py --rps 100 --duration 60 [--mix get:70,create:10,update:5,like:10,delete:5]
+     python load_test.py --like-race 50 [--race-posts 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from utils.api import API_URL
+from utils.datagen import parse_image_mix
+from utils.loadgen import DEFAULT_MIX, LoadGenerator, like_race, parse_mix
+from utils.workers import run_id
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Put load on the /posts API")
+    parser.add_argument("--api-url", default=API_URL)
+    parser.add_argument("--rps", type=float, default=50, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load")
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{name}:{weight}" for name, weight in DEFAULT_MIX.items()),
+        help="Operation weights, e.g. get:70,create:10,update:5,like:10,delete:5"
+    )
+    parser.add_argument("--connections", type=int, default=50, help="Keep-alive connection pool size")
+    parser.add_argument("--max-in-flight", type=int, default=500, help="Requests beyond this are dropped")
+    parser.add_argument("--seed-posts", type=int, default=20, help="Posts created before the run")
+    parser.add_argument("--images", default="0:1", help="Image size mix for created posts (bytes:probability)")
+    parser.add_argument("--report", default="test-results/load_report.json")
+    parser.add_argument("--max-p95", type=float, help="Fail if any endpoint's p95 exceeds this (ms)")
+    parser.add_argument("--max-error-rate", type=float, help="Fail if any endpoint's error rate exceeds this (0-1)")
+    parser.add_argument(
+        "--like-race", type=int, metavar="N",
+        help="Instead of the mix, fire N concurrent likes per post and count lost updates"
+    )
+    parser.add_argument("--race-posts", type=int, default=5, help="Posts liked concurrently in --like-race")
+    parser.add_argument("--max-lost-rate", type=float, help="Fail if the --like-race lost-update rate exceeds this (0-1)")
+    return parser.parse_args()
+
+def check_thresholds(report, max_p95, max_error_rate):
+    """Return a list of threshold violations"""
+    failures = []
+    for name, endpoint in report["endpoints"].items():
+        if max_p95 is not None and endpoint["p95_ms"] is not None and endpoint["p95_ms"] > max_p95:
+            failures.append(f"{name}: p95 {endpoint['p95_ms']} ms > {max_p95} ms")
+        if max_error_rate is not None and endpoint["error_rate"] > max_error_rate:
+            failures.append(f"{name}: error rate {endpoint['error_rate']:.2%} > {max_error_rate:.2%}")
+    return failures
+
+def write_report(report, path):
+    """Write the JSON report next to the other test results"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📊 Report written to {path}")
+
+def run_like_race(options):
+    """Quantify the likePost read-modify-write race"""
+    print("\n" + "="*70)
+    print("MERN MEMORIES - LIKEPOST CONTENTION TEST")
+    print("="*70)
+    print(f"{options.like_race} concurrent likes on each of {options.race_posts} posts")
+    print("-"*70)
+    
+    report = asyncio.run(like_race(
+        options.api_url,
+        posts=options.race_posts,
+        likes_per_post=options.like_race,
+        connections=options.connections,
+        tag=f"load-{run_id()}",
+    ))
+    
+    for post in report["per_post"]:
+        print(f"{post['id']}: {post['successful_likes']} likes succeeded, likeCount {post['like_count']}")
+    latency = report["latency"]
+    print("-"*70)
+    print(f"Lost updates: {report['lost_updates']} of {report['successful_likes']} ({report['lost_update_rate']:.1%})")
+    print(f"Like latency under contention: p50 {latency['p50_ms']} ms, p95 {latency['p95_ms']} ms, "
+          f"p99 {latency['p99_ms']} ms, errors {latency['errors']}")
+    
+    write_report(report, options.report)
+    
+    if options.max_lost_rate is not None and report["lost_update_rate"] > options.max_lost_rate:
+        print(f"❌ Lost-update rate {report['lost_update_rate']:.2%} > {options.max_lost_rate:.2%}")
+        return 1
+    return 0
+
+def main():
+    """Run the load and write the report"""
+    options = parse_args()
+    if options.like_race:
+        return run_like_race(options)
+    
+    print("\n" + "="*70)
+    print("MERN MEMORIES - POSTS API LOAD TEST")
+    print("="*70)
+    print(f"Target: {options.api_url}/posts at {options.rps:g} req/s for {options.duration:g}s")
+    print(f"Mix: {options.mix}")
+    print("-"*70)
+    
+    generator = LoadGenerator(
+        options.api_url,
+        rps=options.rps,
+        duration=options.duration,
+        mix=parse_mix(options.mix),
+        connections=options.connections,
+        max_in_flight=options.max_in_flight,
+        seed_posts=options.seed_posts,
+        tag=f"load-{run_id()}",
+        image_mix=parse_image_mix(options.images),
+    )
+    report = asyncio.run(generator.run())
+    
+    print(f"{'endpoint':<10}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, endpoint in report["endpoints"].items():
+        print(
+            f"{name:<10}{endpoint['count']:>8}{endpoint['errors']:>8}"
+            f"{endpoint['p50_ms'] or 0:>10.1f}{endpoint['p95_ms'] or 0:>10.1f}"
+            f"{endpoint['p99_ms'] or 0:>10.1f}{endpoint['max_ms']:>10.1f}"
+        )
+    print("-"*70)
+    print(f"Throughput: {report['throughput_rps']} req/s, errors: {report['errors']}, dropped: {report['dropped']}")
+    
+    write_report(report, options.report)
+    
+    failures = check_thresholds(report, options.max_p95, options.max_error_rate)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Within thresholds")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+# Page objects for the Memories app; locators are defined once, here
+from pages.home_page import HomePage
+from pages.post_card import PostCard
+from pages.post_form import PostForm
@@ -0,0 +1,28 @@
+"""
+Shared plumbing for the page objects.
+
+A page object can be given the suite's `locate` fixture, in which case
+lookups go through the learned-locator cache; otherwise the compiled
+Locator is resolved directly.
+"""
+
+
+class BasePage:
+    """Driver plus the lookup function every page object uses"""
+
+    def __init__(self, driver, locate=None):
+        self.driver = driver
+        self.locate = locate
+
+    def find(self, locator, **kwargs):
+        """LocatorMatch for a Locator, or None; one execute_script call"""
+        if self.locate:
+            return self.locate(locator, **kwargs)
+        return locator.find(self.driver, **kwargs)
+
+    def click(self, locator, **kwargs):
+        """Click the first match of a Locator; returns the match, or None"""
+        match = self.find(locator, **kwargs)
+        if match:
+            match.element.click()
+        return match
@@ -0,0 +1,74 @@
+"""
+The single page of the Memories app (client/src/App.js): the app bar,
+the posts grid and the form.
+"""
+
+from pages.base import BasePage
+from pages.post_card import PostCard
+from pages.post_form import PostForm
+from utils.locators import Locator
+from utils.posts import posts_by_title, rendered_posts
+from utils.readiness import POST_CARD_SELECTOR, wait_for_posts_rendered
+
+
+class HomePage(BasePage):
+    """App bar, post cards and form"""
+
+    NAVIGATION = Locator(
+        "navigation",
+        ".MuiAppBar-root", "header", "nav", "[role='navigation']", ".navbar", ".appbar",
+    )
+    HEADING = Locator(
+        "app_heading",
+        ".MuiAppBar-root .MuiTypography-h2", "h1", "h2", ".logo", ".title",
+        ".MuiTypography-h4", "[class*='logo']", "[class*='title']",
+    )
+    CARD = Locator(
+        "memory_card",
+        POST_CARD_SELECTOR, ".memory", ".post", ".card",
+        "[class*='memory']", "[class*='post']", "[class*='card']",
+    )
+    CARD_TITLE = Locator(
+        "card_title",
+        "h2.MuiTypography-h5", "h1, h2, h3, h4, h5, h6", "[class*='title']", "[class*='heading']",
+    )
+    CREATE = Locator(
+        "create_button",
+        "//button[contains(text(), 'Create')]",
+        "//button[contains(text(), 'Add')]",
+        "//button[contains(text(), 'New')]",
+        "//button[@aria-label='create']",
+        "//button[.//*[contains(text(), 'Create')]]",
+        "//a[contains(text(), 'Create')]",
+    )
+
+    def __init__(self, driver, base_url, locate=None):
+        super().__init__(driver, locate)
+        self.base_url = base_url
+        self.form = PostForm(driver, locate)
+
+    def open(self, path=""):
+        """Load the page and wait for the posts to render"""
+        self.driver.get(f"{self.base_url}{path}")
+        wait_for_posts_rendered(self.driver)
+        return self
+
+    def refresh(self):
+        self.driver.refresh()
+        wait_for_posts_rendered(self.driver)
+        return self
+
+    def cards(self):
+        """Every rendered post card, in page order (one script call)"""
+        return [
+            PostCard(self.driver, post.element, post, self.locate)
+            for post in rendered_posts(self.driver)
+        ]
+
+    def card(self, title):
+        """The card showing this title, or None (looked up in the by-title index)"""
+        post = posts_by_title(self.driver).get(title)
+        return PostCard(self.driver, post.element, post, self.locate) if post else None
+
+    def titles(self):
+        return [card.title for card in self.cards()]
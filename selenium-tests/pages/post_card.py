@@ -0,0 +1,74 @@
+"""
+One rendered memory (client/src/components/Posts/Post/Post.js).
+
+Button locators are relative XPaths and are always resolved inside the
+card element, so each action hits the intended post.
+"""
+
+from pages.base import BasePage
+from utils.locators import Locator
+
+
+class PostCard(BasePage):
+    """A post card plus the post it renders (a utils.posts.RenderedPost)"""
+
+    LIKE = Locator(
+        "like_button",
+        ".//button[contains(., 'Like')]",
+        ".//button[@aria-label='like']",
+        ".//*[local-name()='svg' and contains(@class, 'heart')]/ancestor::button",
+    )
+    DELETE = Locator(
+        "delete_button",
+        ".//button[contains(., 'Delete')]",
+        ".//button[@aria-label='delete']",
+        ".//*[contains(@class, 'delete')]",
+    )
+    # The MoreHoriz button in the top-right overlay has no text or label
+    EDIT = Locator(
+        "edit_button",
+        ".//*[contains(@class, 'overlay2')]//button",
+        ".//button[contains(., 'Edit')]",
+        ".//button[@aria-label='edit']",
+        ".//button[not(contains(., 'Like')) and not(contains(., 'Delete'))]",
+    )
+    TAGS = Locator(
+        "post_tags",
+        "h2.MuiTypography-body2", ".tag", "[class*='tag']", ".MuiChip-root",
+        ".//button[contains(text(), '#')]",
+    )
+
+    def __init__(self, driver, element, post=None, locate=None):
+        super().__init__(driver, locate)
+        self.element = element
+        self.post = post
+
+    def __repr__(self):
+        return f"PostCard({self.title!r})"
+
+    @property
+    def title(self):
+        return self.post.title if self.post else None
+
+    @property
+    def like_count(self):
+        return self.post.like_count if self.post else None
+
+    def find(self, locator, **kwargs):
+        kwargs.setdefault("root", self.element)
+        return super().find(locator, **kwargs)
+
+    def like_button(self):
+        return self.find(self.LIKE)
+
+    def like(self):
+        """Click Like; returns the match, or None"""
+        return self.click(self.LIKE)
+
+    def delete(self):
+        """Click Delete; returns the match, or None"""
+        return self.click(self.DELETE)
+
+    def edit(self):
+        """Click the edit (MoreHoriz) button, which loads the post into the form"""
+        return self.click(self.EDIT)
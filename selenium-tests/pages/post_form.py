@@ -0,0 +1,69 @@
+"""
+The create/edit form (client/src/components/Form/Form.js).
+
+The field locators lead with the `name=` attributes Form.js gives its
+TextFields; the remaining candidates only matter if the markup changes.
+"""
+
+from pages.base import BasePage
+from utils.locators import Locator
+
+
+class PostForm(BasePage):
+    """The "Creating a Memory" / "Editing ..." form next to the posts"""
+
+    FORM = Locator("post_form", "form")
+    HEADING = Locator("form_heading", "form h6", "form .MuiTypography-h6")
+    CREATOR = Locator(
+        "creator_field",
+        "input[name='creator']", "input[placeholder*='Creator']", "#creator",
+    )
+    TITLE = Locator(
+        "title_field",
+        "input[name='title']", "textarea[name='title']",
+        "input[placeholder*='Title']", "input[placeholder*='title']", "#title",
+    )
+    MESSAGE = Locator(
+        "message_field",
+        "textarea[name='message']", "textarea[placeholder*='Message']",
+        "textarea[placeholder*='message']", "#message",
+    )
+    TAGS = Locator(
+        "tags_field",
+        "input[name='tags']", "input[placeholder*='Tags']", "input[placeholder*='tags']", "#tags",
+    )
+    SUBMIT = Locator(
+        "submit_button",
+        "form button[type='submit']",
+        "//button[contains(., 'Submit')]",
+        "//button[contains(., 'Save')]",
+        "//button[contains(., 'Update')]",
+    )
+    CLEAR = Locator("clear_button", "//form//button[contains(., 'Clear')]")
+
+    FIELDS = {"creator": CREATOR, "title": TITLE, "message": MESSAGE, "tags": TAGS}
+
+    def field(self, name):
+        """LocatorMatch for a field by its Form.js name, or None"""
+        return self.find(self.FIELDS[name], enabled=False)
+
+    def fill(self, name, value):
+        """Replace a field's text; returns the match, or None if the field is missing"""
+        match = self.field(name)
+        if match:
+            match.element.clear()
+            match.element.send_keys(value)
+        return match
+
+    def heading(self):
+        """'Creating a Memory' or 'Editing "<title>"'"""
+        match = self.find(self.HEADING, enabled=False)
+        return match.element.text if match else None
+
+    def submit(self):
+        """Click Submit; returns the match, or None"""
+        return self.click(self.SUBMIT)
+
+    def clear(self):
+        """Click Clear; returns the match, or None"""
+        return self.click(self.CLEAR)
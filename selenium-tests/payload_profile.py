@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+GET /posts payload profiler for MERN Memories
+Run: python payload_profile.py --counts 10,100,500 --image-sizes 0,20000,200000 [--browser]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from utils.api import API_URL, PostsApi
+from utils.payload import profile_point
+from utils.workers import run_id
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Profile GET /posts as posts and images grow")
+    parser.add_argument("--api-url", default=API_URL)
+    parser.add_argument("--app-url", default=os.getenv("APP_URL", "http://localhost:3000"))
+    parser.add_argument("--counts", default="10,100,500", help="Post counts to load")
+    parser.add_argument("--image-sizes", default="0,20000,200000", help="selectedFile image sizes (bytes)")
+    parser.add_argument("--repeat", type=int, default=5, help="GETs per point (median is reported)")
+    parser.add_argument("--browser", action="store_true", help="Also time JSON.parse and card rendering in Chrome")
+    parser.add_argument("--report", default="test-results/payload_report.json")
+    return parser.parse_args()
+
+def create_browser():
+    """Headless Chrome using the locally resolved chromedriver"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
+    from utils.driver_resolver import resolve_chromedriver
+    
+    chrome_options = Options()
+    for argument in ("--headless", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+                     "--window-size=1920,1080"):
+        chrome_options.add_argument(argument)
+    path = resolve_chromedriver().path
+    return webdriver.Chrome(service=Service(path) if path else Service(), options=chrome_options)
+
+def main():
+    """Profile every (count, image size) point and write the report"""
+    options = parse_args()
+    counts = [int(c) for c in options.counts.split(",")]
+    image_sizes = [int(s) for s in options.image_sizes.split(",")]
+    
+    print("\n" + "="*70)
+    print("MERN MEMORIES - GET /posts PAYLOAD PROFILE")
+    print("="*70)
+    
+    api = PostsApi(options.api_url, pool_size=16, timeout=120)
+    driver = create_browser() if options.browser else None
+    results = []
+    try:
+        header = f"{'posts':>6}{'image B':>9}{'total':>7}{'MB':>9}{'server ms':>11}{'xfer ms':>9}{'parse ms':>10}"
+        if driver:
+            header += f"{'js parse':>10}{'render ms':>11}"
+        print(header)
+        for count in counts:
+            for image_bytes in image_sizes:
+                result = profile_point(
+                    api, count, image_bytes, tag=f"payload-{run_id()}",
+                    repeat=options.repeat, driver=driver, app_url=options.app_url
+                )
+                results.append(result)
+                line = (f"{count:>6}{image_bytes:>9}{result['total_posts']:>7}"
+                        f"{result['bytes'] / 1e6:>9.2f}{result['server_ms']:>11.1f}"
+                        f"{result['transfer_ms']:>9.1f}{result['python_parse_ms']:>10.1f}")
+                if driver:
+                    browser = result["browser"]
+                    line += f"{browser.get('parse_ms', 0):>10.1f}{browser.get('render_ms', 0):>11.1f}"
+                print(line)
+    finally:
+        if driver:
+            driver.quit()
+        api.close()
+    
+    if results:
+        largest = results[-1]
+        print("-"*70)
+        print(f"Bytes by field at {largest['count']} posts / {largest['image_bytes']} B images:")
+        for field, size in largest["bytes_by_field"].items():
+            print(f"  {field:<14}{size:>14,} B  {size / largest['bytes']:>6.1%}")
+    
+    os.makedirs(os.path.dirname(options.report) or ".", exist_ok=True)
+    with open(options.report, "w") as f:
+        json.dump({"api_url": options.api_url, "points": results}, f, indent=2)
+    print(f"📊 Report written to {options.report}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
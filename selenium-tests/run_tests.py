@@ -1,15 +1,30 @@
 #!/usr/bin/env python3
 """
 Selenium Test Runner for MERN Memories
-Run: python run_tests.py
+Run: python run_tests.py [--workers N|auto]
 """
 
+import argparse
 import pytest
 import sys
 import os
 
+from utils.workers import run_id
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Run the MERN Memories Selenium suite")
+    parser.add_argument(
+        "--workers", "-n",
+        default=os.getenv("TEST_WORKERS", "1"),
+        help="Parallel workers, each with its own Chrome ('auto' = one per CPU core)"
+    )
+    return parser.parse_args()
+
 def main():
     """Main test runner"""
+    options = parse_args()
+    
     print("\n" + "="*70)
     print("MERN MEMORIES - SELENIUM TEST SUITE")
     print("="*70)
@@ -24,7 +39,12 @@ def main():
         "--tb=short",                # Short traceback
     ]
     
-    print(f"\nRunning tests with arguments: {args}")
+    # Worker pool mode (pytest-xdist); loadfile keeps each module on one worker, in order
+    if options.workers not in ("0", "1"):
+        args += ["-n", options.workers, "--dist", "loadfile"]
+    
+    print(f"\nRun ID: {run_id()}")
+    print(f"Running tests with arguments: {args}")
     print("-"*70 + "\n")
     
     # Run tests
@@ -49,4 +69,4 @@ def main():
     return exit_code
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -1,97 +1,243 @@
 import pytest
 import time
 import os
-import subprocess
+import shutil
+import tempfile
+import itertools
+from html import escape
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
 
+try:
+    import pytest_html
+except ImportError:
+    pytest_html = None
+
+from utils.locators import Locator, find_first
+from utils.api import API_URL, PostsApi, run_tag
+from utils.api_replay import API_MODE, MODES, ApiInterceptor, ApiRecording
+from utils.mock_api import MOCK_API, MockPostsServer
+from utils.datagen import generate_posts, load_via_api, parse_image_mix
+from utils.command_timing import CommandTimer, slowest, slowest_table_html, timeline_html
+from utils.baseline import BaselineStore, collect_samples, current_commit, format_regression
+from utils.app_server import MernApp, recent_output_from_logs
+from utils.browser_pool import BrowserPool
+from utils.driver_resolver import resolve_chromedriver
+from utils.network import install_network_tracker
+from utils.screenshots import ScreenshotService
+from utils.visual import check_page
+from utils.perf_metrics import PerfRecorder, check_budgets, install_perf_observers, load_budgets
+from utils.locator_cache import LocatorCache, DEFAULT_CACHE_PATH, build_hash_from_page
+from utils.readiness import POLL_INTERVAL
+from utils.workers import free_port, is_controller, namespace, run_id, worker_name
+
 # Load environment variables
 load_dotenv()
 
+WINDOW_SIZE = (1920, 1080)
+
 # Global variables
-backend_process = None
-frontend_process = None
+mern_app = None
+mock_api = None
+
+def start_mock_api():
+    """Serve /posts from memory in this process and point the API client and the frontend at it"""
+    global mock_api
+    mock_api = MockPostsServer().start()
+    # Set before the frontend and any xdist workers are spawned, so both inherit it
+    os.environ["API_URL"] = os.environ["REACT_APP_API_URL"] = mock_api.url
+    print(f"🧪 Mock posts API on {mock_api.url}/posts")
+
+def stop_mock_api():
+    global mock_api
+    if mock_api:
+        mock_api.stop()
+        mock_api = None
 
 def start_mern_app():
-    """Start MERN application locally"""
-    global backend_process, frontend_process
-    
-    print("\n" + "="*60)
-    print("STARTING MERN MEMORIES APPLICATION")
-    print("="*60)
-    
-    # Start Backend
-    backend_dir = os.path.join(os.path.dirname(__file__), "../../backend")
-    if os.path.exists(backend_dir):
-        print(f"📦 Starting backend from: {backend_dir}")
-        backend_process = subprocess.Popen(
-            ["npm", "start"],
-            cwd=backend_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            shell=True
-        )
-        print("✅ Backend started on port 5000")
-    else:
-        print("⚠️  Backend directory not found")
-    
-    # Start Frontend
-    frontend_dir = os.path.join(os.path.dirname(__file__), "../../frontend")
-    if os.path.exists(frontend_dir):
-        print(f"🎨 Starting frontend from: {frontend_dir}")
-        frontend_process = subprocess.Popen(
-            ["npm", "start"],
-            cwd=frontend_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            shell=True
-        )
-        print("✅ Frontend started on port 3000")
-    else:
-        print("⚠️  Frontend directory not found")
-    
-    # Wait for servers
-    print("⏳ Waiting for servers to start (15 seconds)...")
-    time.sleep(15)
-    print("="*60 + "\n")
+    """Start MERN application locally and wait until it answers"""
+    global mern_app
+    mern_app = MernApp(backend=API_MODE != "replay" and not MOCK_API)
+    if not mern_app.start():
+        tails = "\n".join(f"--- {s.name} ({s.log_path}) ---\n{s.log_tail()}" for s in mern_app.services)
+        # sessionfinish does not run after an exit from sessionstart, so clean up here
+        mern_app.stop(force=True)
+        mern_app = None
+        stop_mock_api()
+        pytest.exit(f"MERN app did not become ready\n{tails}", returncode=pytest.ExitCode.INTERNAL_ERROR)
 
 def stop_mern_app():
     """Stop MERN application"""
-    global backend_process, frontend_process
-    
-    print("\n" + "="*60)
-    print("STOPPING MERN MEMORIES APPLICATION")
-    print("="*60)
-    
-    if frontend_process:
-        frontend_process.terminate()
-        print("✅ Frontend stopped")
-    
-    if backend_process:
-        backend_process.terminate()
-        print("✅ Backend stopped")
-    
-    print("="*60)
+    global mern_app
+    if mern_app:
+        mern_app.stop()
+        mern_app = None
 
 def pytest_sessionstart(session):
-    """Start app before all tests"""
+    """Start app before all tests (once, in the xdist controller)"""
+    run_id()
+    if API_MODE not in MODES:
+        raise pytest.UsageError(f"API_MODE must be one of {', '.join(MODES)}, got {API_MODE!r}")
+    if MOCK_API and is_controller(session.config):
+        start_mock_api()
     use_local = os.getenv("USE_LOCAL", "true").lower() == "true"
-    if use_local:
+    if use_local and is_controller(session.config):
         start_mern_app()
 
+def pytest_configure(config):
+    config.addinivalue_line("markers", "live_api: checks data it wrote through the UI, needs the real backend")
+
+def pytest_collection_modifyitems(config, items):
+    """Replayed responses can't reflect what a test writes through the form"""
+    if API_MODE != "replay":
+        return
+    skip = pytest.mark.skip(reason="Needs the live backend (API_MODE=replay)")
+    for item in items:
+        if "live_api" in item.keywords:
+            item.add_marker(skip)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the recent backend/frontend output to failed test reports"""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call":
+        attach_command_timeline(item, report)
+        if report.passed:
+            record_performance(item, report)
+    if not report.failed:
+        return
+    driver = item.funcargs.get("driver") if report.when != "teardown" else None
+    if driver is not None:
+        try:
+            filename = get_screenshots().capture(driver, f"FAILED_{item.name}", failure=True)
+            if filename:
+                report.sections.append(("Failure screenshot", filename))
+        except Exception as e:
+            print(f"⚠️  Could not capture failure screenshot: {e}")
+    output = mern_app.recent_output() if mern_app else recent_output_from_logs()
+    for name, text in output.items():
+        if text:
+            report.sections.append((f"{name} output (most recent lines)", text))
+
+screenshots = None
+
+def get_screenshots():
+    """Background screenshot service shared by the session"""
+    global screenshots
+    if screenshots is None:
+        screenshots = ScreenshotService()
+    return screenshots
+
+api_recording = None
+
+def get_api_recording():
+    """Recorded /posts exchanges shared by every tab (API_MODE=record|replay)"""
+    global api_recording
+    if api_recording is None:
+        api_recording = ApiRecording(run=run_id())
+        if API_MODE == "replay":
+            print(f"📼 Replaying {len(api_recording.entries)} recorded /posts responses from {api_recording.path}")
+    return api_recording
+
+baseline_store = None
+perf_regressions = []
+slowest_commands = []
+SLOWEST_COMMANDS = int(os.getenv("SLOWEST_COMMANDS", "15"))
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Collect the browser metrics of every page the test visited, including the last one"""
+    outcome = yield
+    driver = item.funcargs.get("driver")
+    if driver is not None and hasattr(driver, "perf"):
+        visits = driver.perf.flush()
+        item.user_properties.append(("perf_visits", visits))
+        # PERF_ENFORCE=true applies the budgets to every visit; failing here fails the test, not its teardown
+        if outcome.excinfo is None and os.getenv("PERF_ENFORCE", "false").lower() == "true":
+            budgets = load_budgets()
+            violations = [v for visit in visits for v in check_budgets(visit, budgets)]
+            if violations:
+                outcome.force_exception(pytest.fail.Exception(
+                    "Performance budget exceeded:\n" + "\n".join(violations), pytrace=False
+                ))
+    if driver is not None and hasattr(driver, "timer"):
+        item.command_events = list(driver.timer.events)
+
+def attach_command_timeline(item, report):
+    """Per-test WebDriver timeline in the HTML report; the slowest commands feed the summary table"""
+    events = getattr(item, "command_events", None)
+    if not events:
+        return
+    report.user_properties.append(("slowest_commands", slowest(events, SLOWEST_COMMANDS)))
+    if pytest_html is not None:
+        report.extras = getattr(report, "extras", []) + [pytest_html.extras.html(timeline_html(events))]
+
+def record_performance(item, report):
+    """Append a passing test's timings to the history store and flag regressions against it"""
+    global baseline_store
+    visits = dict(item.user_properties).get("perf_visits")
+    try:
+        if baseline_store is None:
+            baseline_store = BaselineStore()
+        baseline_store.record(run_id(), current_commit(), item.nodeid, collect_samples(report.duration, visits))
+        regressions = baseline_store.detect(item.nodeid)
+    except Exception as e:
+        print(f"⚠️  Could not update performance history: {e}")
+        return
+    
+    if regressions:
+        lines = [format_regression(r) for r in regressions]
+        report.sections.append(("Performance regressions", "\n".join(lines)))
+        # user_properties travel back to the xdist controller with the report
+        report.user_properties.append(("perf_regressions", lines))
+
+def pytest_runtest_logreport(report):
+    """Gather regressions and slow commands from every worker for the summary"""
+    for name, value in report.user_properties:
+        if name == "perf_regressions":
+            perf_regressions.append((report.nodeid, value))
+        elif name == "slowest_commands":
+            slowest_commands.extend((report.nodeid, event) for event in value)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    """List flagged performance regressions and the slowest commands at the top of the HTML report"""
+    if perf_regressions:
+        items = "".join(
+            f"<li><b>{escape(nodeid)}</b><ul>{''.join(f'<li>{escape(line)}</li>' for line in lines)}</ul></li>"
+            for nodeid, lines in perf_regressions
+        )
+        prefix.append(f"<h2>⚠️ Performance regressions</h2><ul>{items}</ul>")
+    if slowest_commands:
+        top = sorted(slowest_commands, key=lambda entry: entry[1]["duration_ms"], reverse=True)
+        postfix.append(slowest_table_html(top[:SLOWEST_COMMANDS]))
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    """Mark tests with a regression in the results table"""
+    if any(name == "perf_regressions" for name, _ in report.user_properties):
+        cells[1] = cells[1].replace("</td>", " ⚠️ slower</td>", 1)
+
 def pytest_sessionfinish(session, exitstatus):
-    """Stop app after all tests"""
+    """Flush queued screenshots and stop app after all tests"""
+    if screenshots:
+        written = screenshots.close()
+        print(f"📸 {len(written)} screenshots written to {screenshots.directory}/")
+    if api_recording and API_MODE == "record":
+        saved = api_recording.save()
+        print(f"📼 Recorded {saved} /posts responses to {api_recording.path}")
     use_local = os.getenv("USE_LOCAL", "true").lower() == "true"
-    if use_local:
+    if use_local and is_controller(session.config):
         stop_mern_app()
+    stop_mock_api()
 
-@pytest.fixture(scope="session")
-def driver():
-    """Create and configure Chrome driver using webdriver-manager"""
+def create_driver():
+    """Create and configure Chrome driver with a locally resolved chromedriver"""
     chrome_options = Options()
     
     # Headless mode for CI/CD
@@ -102,8 +248,12 @@ def driver():
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--remote-debugging-port=9222")
+    chrome_options.add_argument(f"--window-size={WINDOW_SIZE[0]},{WINDOW_SIZE[1]}")
+    
+    # Each browser gets its own debugging port and profile so parallel Chromes don't collide
+    profile_dir = tempfile.mkdtemp(prefix=f"chrome-{worker_name()}-")
+    chrome_options.add_argument(f"--remote-debugging-port={free_port()}")
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
     
     # Add user agent
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
@@ -111,36 +261,92 @@ def driver():
     # Disable logging for cleaner output
     chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
     
-    # Initialize driver with webdriver-manager
-    print("🔧 Initializing Chrome driver with webdriver-manager...")
+    # Initialize driver with the pinned/cached chromedriver (no network on warm runs)
+    print("🔧 Initializing Chrome driver...")
     try:
-        # Use webdriver-manager to automatically download and manage chromedriver
-        service = Service(ChromeDriverManager().install())
+        resolution = resolve_chromedriver()
+        service = Service(resolution.path) if resolution.path else Service()
         driver = webdriver.Chrome(service=service, options=chrome_options)
         print(f"✅ Chrome driver initialized: {driver.capabilities['browserVersion']}")
     except Exception as e:
         print(f"❌ Failed to initialize driver: {e}")
-        # Fallback to system chromedriver if webdriver-manager fails
+        # Fallback to system chromedriver if the resolved binary fails
         print("⚠️  Falling back to system chromedriver...")
         driver = webdriver.Chrome(options=chrome_options)
     
+    driver.profile_dir = profile_dir
+    driver.perf = PerfRecorder(driver)
+    driver.timer = CommandTimer(driver)
     driver.implicitly_wait(15)  # Increased for local server
     driver.set_page_load_timeout(30)
+    setup_tab(driver)
+    return driver
+
+def setup_tab(driver):
+    """Per-tab setup, repeated whenever the pool hands out a fresh tab"""
+    # Count fetch/XHR requests in every page (driver.pending_requests / wait_for_network_idle)
+    try:
+        install_network_tracker(driver)
+    except Exception as e:
+        print(f"⚠️  Could not install network tracker: {e}")
     
-    yield driver
+    # Navigation/paint timing, LCP, long tasks and CDP metrics for every visit (driver.perf)
+    try:
+        install_perf_observers(driver)
+    except Exception as e:
+        print(f"⚠️  Could not install performance observers: {e}")
+    driver.perf.reset()
     
-    # Cleanup
+    # Record or replay the /posts backend for this tab (API_MODE)
+    if API_MODE != "live":
+        if getattr(driver, "api_interceptor", None):
+            driver.api_interceptor.stop()
+        driver.api_interceptor = ApiInterceptor(
+            driver, API_MODE, get_api_recording(), api_url=os.getenv("API_URL", API_URL)
+        ).start()
+
+def close_driver(driver):
+    """Save the final screenshot and remove the browser profile"""
     try:
-        driver.save_screenshot("final_state.png")
+        final_name = "final_state.png" if worker_name() == "main" else f"final_state_{worker_name()}.png"
+        driver.save_screenshot(final_name)
         print("📸 Final screenshot saved")
     except Exception as e:
         print(f"⚠️  Could not save final screenshot: {e}")
     
+    if getattr(driver, "api_interceptor", None):
+        driver.api_interceptor.stop()
+    
     try:
         driver.quit()
         print("✅ Chrome driver closed")
     except:
         pass
+    shutil.rmtree(driver.profile_dir, ignore_errors=True)
+
+@pytest.fixture(scope="session")
+def browser_pool(base_url):
+    """Pre-warmed browsers, reset between tests instead of restarted"""
+    parsed = urlparse(base_url)
+    pool = BrowserPool(
+        create_driver,
+        size=int(os.getenv("BROWSER_POOL_SIZE", "1")),
+        origins=[f"{parsed.scheme}://{parsed.netloc}"],
+        window_size=WINDOW_SIZE,
+        on_reset=setup_tab,
+    ).warm()
+    yield pool
+    pool.close(teardown=close_driver)
+
+@pytest.fixture(scope="function")
+def driver(browser_pool):
+    """Clean browser for one test, taken from the warm pool"""
+    driver = browser_pool.acquire()
+    driver.perf.reset()
+    driver.timer.reset()
+    yield driver
+    # Every page the test visited was measured and checked in pytest_runtest_call
+    browser_pool.release(driver)
 
 @pytest.fixture(scope="session")
 def base_url():
@@ -149,35 +355,129 @@ def base_url():
     print(f"🌐 Using base URL: {app_url}")
     return app_url
 
+@pytest.fixture(scope="session")
+def data_namespace():
+    """Run/worker namespace embedded in every record a test creates"""
+    return namespace()
+
+@pytest.fixture(scope="session")
+def api(data_namespace):
+    """Pooled posts API client; bulk-deletes everything this run/worker created at the end"""
+    if API_MODE == "replay":
+        pytest.skip("Needs the live backend (API_MODE=replay)")
+    # Read at runtime: with MOCK_API the URL is only known once the session has started
+    client = PostsApi(os.getenv("API_URL", API_URL))
+    yield client
+    try:
+        deleted = client.delete_tagged(run_tag(data_namespace))
+        print(f"🧹 Deleted {deleted} test memories tagged {run_tag(data_namespace)}")
+    except Exception as e:
+        print(f"⚠️  Teardown cleanup failed: {e}")
+    client.close()
+
+_seed_counter = itertools.count(1)
+
+@pytest.fixture(scope="function")
+def seed_post(api, data_namespace):
+    """Create posts through POST /posts; they are deleted again after the test"""
+    created = []
+    
+    def _seed_post(**fields):
+        number = next(_seed_counter)
+        post = {
+            "title": f"Seeded Memory {data_namespace} {number}",
+            "message": f"Seeded through the API for {data_namespace}",
+            "creator": "selenium",
+            "tags": ["seeded", run_tag(data_namespace)],
+            "selectedFile": "",
+        }
+        post.update(fields)
+        result = api.create_post(post)
+        created.append(result["_id"])
+        return result
+    
+    yield _seed_post
+    api.delete_many(created)
+
+@pytest.fixture(scope="session")
+def bulk_posts(request, data_namespace):
+    """Load BULK_POSTS synthetic memories for the session (no-op when unset)"""
+    count = int(os.getenv("BULK_POSTS", "0"))
+    if not count:
+        yield []
+        return
+    
+    # Only asked for here, so the homepage tests don't need the backend when nothing is loaded
+    api = request.getfixturevalue("api")
+    tag = f"bulk-{data_namespace}"
+    image_mix = os.getenv("BULK_IMAGE_MIX")
+    posts = generate_posts(
+        count, seed=int(os.getenv("BULK_SEED", "0")), tags=[tag],
+        image_mix=parse_image_mix(image_mix) if image_mix else None
+    )
+    start = time.perf_counter()
+    ids = load_via_api(api, posts, concurrency=api.pool_size)
+    print(f"🌱 Loaded {len(ids)} bulk memories in {time.perf_counter() - start:.1f}s")
+    yield ids
+    api.delete_many(ids)
+
 @pytest.fixture(scope="function")
 def wait(driver):
     """Provide WebDriverWait instance"""
-    return WebDriverWait(driver, 20)
+    return WebDriverWait(driver, 20, poll_frequency=POLL_INTERVAL)
+
+@pytest.fixture(scope="session")
+def locator_cache():
+    """Learned-selector cache shared by the whole session"""
+    cache = LocatorCache(os.getenv("LOCATOR_CACHE", DEFAULT_CACHE_PATH))
+    yield cache
+    try:
+        cache.save()
+    except Exception as e:
+        print(f"⚠️  Could not save locator cache: {e}")
+
+@pytest.fixture(scope="function")
+def locate(driver, locator_cache):
+    """Find a logical element, trying the learned selector before the full list"""
+    def _locate(name, candidates=None, **kwargs):
+        if isinstance(name, Locator):
+            name, candidates = name.name, name
+        if not locator_cache.bound:
+            locator_cache.bind(build_hash_from_page(driver))
+        match = find_first(driver, candidates, prefer=locator_cache.lookup(name), **kwargs)
+        if match:
+            locator_cache.record(match.page, name, match.selector)
+        return match
+    return _locate
 
 @pytest.fixture(scope="function")
 def take_screenshot(driver):
-    """Take screenshot helper"""
+    """Take screenshot helper (a checkpoint; see SCREENSHOTS for which are kept)"""
     def _take_screenshot(name):
-        screenshot_dir = "screenshots"
-        if not os.path.exists(screenshot_dir):
-            os.makedirs(screenshot_dir)
-        
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = f"{screenshot_dir}/{name}_{timestamp}.png"
-        driver.save_screenshot(filename)
-        print(f"📸 Screenshot saved: {filename}")
+        filename = get_screenshots().capture(driver, name)
+        if filename:
+            print(f"📸 Screenshot queued: {filename}")
         return filename
     return _take_screenshot
 
 @pytest.fixture(scope="function")
-def cleanup_memories(driver, base_url):
-    """Cleanup after test by deleting test memories"""
+def visual_check(driver, request):
+    """Compare the viewport with its golden image (per test, name and viewport size)"""
+    def _visual_check(name, mask=()):
+        result = check_page(driver, f"{request.node.name}_{name}", mask)
+        print(f"🖼️  {result.message} ({result.seconds * 1000:.0f} ms)")
+        if result.diff_path:
+            print(f"🖼️  Diff image: {result.diff_path}")
+        return result
+    return _visual_check
+
+@pytest.fixture(scope="function")
+def cleanup_memories(api, data_namespace):
+    """Delete the memories this test created through the UI (tagged run-<namespace>) right after it"""
     yield
-    # This runs after each test
+    # The api fixture's session-end sweep does the same, but only if it was set up before
     try:
-        driver.get(base_url)
-        time.sleep(2)
-        # Logic to delete test memories if needed
-        print("🧹 Test cleanup completed")
+        deleted = api.delete_tagged(run_tag(data_namespace))
+        print(f"🧹 Test cleanup completed ({deleted} memories deleted)")
     except Exception as e:
         print(f"⚠️  Cleanup failed: {e}")
\ No newline at end of file
@@ -1,59 +1,32 @@
 import pytest
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages import HomePage, PostCard, PostForm
+from utils.dom_snapshot import displayed, snapshot
+from utils.readiness import (
+    store_snapshot, wait_for_network_idle, wait_for_posts_rendered, wait_for_store_update
+)
+
 class TestFunctionalFeatures:
     """Test functional features like likes, search, etc."""
     
-    def test_08_like_memory(self, driver, base_url, wait, take_screenshot):
+    def test_08_like_memory(self, driver, base_url, wait, take_screenshot, locate, seed_post):
         """Test 8: Like/unlike functionality"""
         print("🧪 Test 8: Like memory")
         
-        driver.get(base_url)
-        time.sleep(3)
-        
-        # Find like button
-        like_selectors = [
-            "//button[contains(text(), 'Like')]",
-            "//button[@aria-label='like']",
-            "//*[contains(@class, 'like')]",
-            "//svg[contains(@class, 'like')]/ancestor::button",
-            "//button[.//*[contains(text(), 'Like')]]"
-        ]
+        # Make sure there is a memory to act on
+        seeded = seed_post()
         
-        like_button = None
-        for xpath in like_selectors:
-            try:
-                buttons = driver.find_elements(By.XPATH, xpath)
-                for button in buttons:
-                    if button.is_displayed() and button.is_enabled():
-                        like_button = button
-                        print(f"✅ Found like button: {xpath}")
-                        break
-                if like_button:
-                    break
-            except:
-                continue
+        home = HomePage(driver, base_url, locate).open()
         
-        if not like_button:
-            print("ℹ️ No like button found, checking for heart icons")
-            heart_selectors = [
-                "//*[local-name()='svg' and contains(@class, 'heart')]/ancestor::button",
-                "//button[.//*[local-name()='svg']]"
-            ]
-            for xpath in heart_selectors:
-                try:
-                    buttons = driver.find_elements(By.XPATH, xpath)
-                    for button in buttons:
-                        if button.is_displayed():
-                            like_button = button
-                            print(f"✅ Found heart button: {xpath}")
-                            break
-                    if like_button:
-                        break
-                except:
-                    continue
+        # Find the like button on the seeded memory's card
+        like_button = None
+        card = home.card(seeded["title"])
+        match = card.like_button() if card else None
+        if match:
+            like_button = match.element
+            print(f"✅ Found like button: {match.selector}")
         
         if not like_button:
             print("⚠️ No like functionality found")
@@ -66,11 +39,12 @@ class TestFunctionalFeatures:
         take_screenshot("before_like")
         
         # Click like button
+        before = store_snapshot(driver)
         like_button.click()
         print("✅ Clicked like button")
         
         # Wait for animation/state change
-        time.sleep(2)
+        before = wait_for_store_update(driver, before) or before
         take_screenshot("after_like")
         
         # Get new state
@@ -88,16 +62,16 @@ class TestFunctionalFeatures:
         # Try to unlike (click again)
         like_button.click()
         print("✅ Clicked again (unlike)")
-        time.sleep(1)
+        wait_for_store_update(driver, before)
         
         print("✅ Test 8: Like functionality tested")
     
-    def test_09_search_functionality(self, driver, base_url, wait, take_screenshot):
+    def test_09_search_functionality(self, driver, base_url, wait, take_screenshot, locate):
         """Test 9: Search memories"""
         print("🧪 Test 9: Search functionality")
         
         driver.get(base_url)
-        time.sleep(3)
+        wait_for_posts_rendered(driver)
         
         # Find search input
         search_selectors = [
@@ -110,18 +84,10 @@ class TestFunctionalFeatures:
         ]
         
         search_input = None
-        for selector in search_selectors:
-            try:
-                inputs = driver.find_elements(By.CSS_SELECTOR, selector)
-                for inp in inputs:
-                    if inp.is_displayed():
-                        search_input = inp
-                        print(f"✅ Found search input: {selector}")
-                        break
-                if search_input:
-                    break
-            except:
-                continue
+        match = locate("search_input", search_selectors, enabled=False)
+        if match:
+            search_input = match.element
+            print(f"✅ Found search input: {match.selector}")
         
         if not search_input:
             print("ℹ️ No search input found, checking for search button")
@@ -131,32 +97,15 @@ class TestFunctionalFeatures:
                 "//button[.//*[contains(text(), 'Search')]]",
                 "//button[contains(@class, 'search')]"
             ]
-            for xpath in search_button_selectors:
-                try:
-                    buttons = driver.find_elements(By.XPATH, xpath)
-                    for button in buttons:
-                        if button.is_displayed():
-                            button.click()
-                            time.sleep(1)
-                            # Now try to find search input again
-                            for selector in search_selectors:
-                                try:
-                                    inputs = driver.find_elements(By.CSS_SELECTOR, selector)
-                                    for inp in inputs:
-                                        if inp.is_displayed():
-                                            search_input = inp
-                                            print(f"✅ Found search input after button click: {selector}")
-                                            break
-                                    if search_input:
-                                        break
-                                except:
-                                    continue
-                        if search_input:
-                            break
-                    if search_input:
-                        break
-                except:
-                    continue
+            button_match = locate("search_button", search_button_selectors, enabled=False)
+            if button_match:
+                button_match.element.click()
+                wait_for_network_idle(driver)
+                # Now try to find search input again
+                match = locate("search_input", search_selectors, enabled=False)
+                if match:
+                    search_input = match.element
+                    print(f"✅ Found search input after button click: {match.selector}")
         
         if not search_input:
             print("⚠️ No search functionality found")
@@ -172,7 +121,7 @@ class TestFunctionalFeatures:
         
         # Submit search (press Enter or wait)
         search_input.submit()
-        time.sleep(3)
+        wait_for_network_idle(driver)
         
         take_screenshot("search_results")
         
@@ -193,30 +142,14 @@ class TestFunctionalFeatures:
         print("🧪 Test 10: Tags filter")
         
         driver.get(base_url)
-        time.sleep(3)
+        wait_for_posts_rendered(driver)
         
         # Find tags
-        tag_selectors = [
-            ".tag", "[class*='tag']", ".MuiChip-root",
-            "button:contains('#')", "//button[contains(text(), '#')]"
+        tags_found = [
+            (tag.element, tag.text)
+            for tag in displayed(snapshot(driver, PostCard.TAGS, elements=True), enabled=True, min_text=1)
         ]
         
-        tags_found = []
-        for selector in tag_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                for elem in elements:
-                    if elem.is_displayed() and elem.is_enabled():
-                        tag_text = elem.text
-                        if tag_text and len(tag_text) > 0:
-                            tags_found.append((elem, tag_text))
-            except:
-                continue
-        
         print(f"🔖 Found {len(tags_found)} tag(s)")
         
         if not tags_found:
@@ -235,7 +168,7 @@ class TestFunctionalFeatures:
         print(f"✅ Clicked tag: {tag_text}")
         
         # Wait for filter
-        time.sleep(3)
+        wait_for_network_idle(driver)
         take_screenshot("after_tag_filter")
         
         # Check if filtered
@@ -251,12 +184,12 @@ class TestFunctionalFeatures:
         
         print("✅ Test 10: Tag filter tested")
     
-    def test_11_sort_functionality(self, driver, base_url, wait, take_screenshot):
+    def test_11_sort_functionality(self, driver, base_url, wait, take_screenshot, locate):
         """Test 11: Sort memories"""
         print("🧪 Test 11: Sort functionality")
         
         driver.get(base_url)
-        time.sleep(3)
+        wait_for_posts_rendered(driver)
         
         # Find sort dropdown/button
         sort_selectors = [
@@ -269,22 +202,10 @@ class TestFunctionalFeatures:
         ]
         
         sort_element = None
-        for selector in sort_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                for elem in elements:
-                    if elem.is_displayed():
-                        sort_element = elem
-                        print(f"✅ Found sort element: {selector}")
-                        break
-                if sort_element:
-                    break
-            except:
-                continue
+        match = locate("sort_control", sort_selectors, enabled=False)
+        if match:
+            sort_element = match.element
+            print(f"✅ Found sort element: {match.selector}")
         
         if not sort_element:
             print("ℹ️ No sort functionality found")
@@ -313,7 +234,7 @@ class TestFunctionalFeatures:
                         break
                 
                 # Wait for sort to apply
-                time.sleep(3)
+                wait_for_network_idle(driver)
                 take_screenshot("after_sort_change")
             else:
                 print("ℹ️ Only one sort option available")
@@ -321,7 +242,7 @@ class TestFunctionalFeatures:
         elif sort_element.tag_name == "button":
             # It's a button that might open sort options
             sort_element.click()
-            time.sleep(1)
+            wait_for_network_idle(driver)
             take_screenshot("sort_options_opened")
             
             # Look for sort options
@@ -332,52 +253,29 @@ class TestFunctionalFeatures:
                 "//*[@role='menuitem']"
             ]
             
-            for xpath in option_selectors:
-                try:
-                    options = driver.find_elements(By.XPATH, xpath)
-                    if options:
-                        options[0].click()
-                        print(f"✅ Selected sort option: {xpath}")
-                        break
-                except:
-                    continue
+            match = locate("sort_option", option_selectors, visible=False, enabled=False)
+            if match:
+                match.element.click()
+                print(f"✅ Selected sort option: {match.selector}")
         
         print("✅ Test 11: Sort functionality tested")
     
-    def test_12_form_validation(self, driver, base_url, wait, take_screenshot):
+    def test_12_form_validation(self, driver, base_url, wait, take_screenshot, locate):
         """Test 12: Form validation"""
         print("🧪 Test 12: Form validation")
         
         # Go to create page
         driver.get(f"{base_url}/create")
-        time.sleep(3)
+        wait_for_posts_rendered(driver)
         
         take_screenshot("empty_form")
         
         # Try to submit empty form
-        submit_selectors = [
-            "button[type='submit']",
-            "//button[@type='submit']",
-            "//button[contains(text(), 'Submit')]"
-        ]
-        
         submit_button = None
-        for selector in submit_selectors:
-            try:
-                if selector.startswith("//"):
-                    buttons = driver.find_elements(By.XPATH, selector)
-                else:
-                    buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                for button in buttons:
-                    if button.is_displayed() and button.is_enabled():
-                        submit_button = button
-                        print(f"✅ Found submit button: {selector}")
-                        break
-                if submit_button:
-                    break
-            except:
-                continue
+        match = locate(PostForm.SUBMIT)
+        if match:
+            submit_button = match.element
+            print(f"✅ Found submit button: {match.selector}")
         
         if not submit_button:
             print("⚠️ No submit button found")
@@ -387,7 +285,7 @@ class TestFunctionalFeatures:
         submit_button.click()
         print("✅ Submitted empty form")
         
-        time.sleep(2)
+        wait_for_network_idle(driver)
         take_screenshot("after_empty_submit")
         
         # Check for validation errors
@@ -396,18 +294,10 @@ class TestFunctionalFeatures:
             "[role='alert']", ".validation", "[class*='invalid']"
         ]
         
-        errors_found = []
-        for selector in error_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for elem in elements:
-                    if elem.is_displayed():
-                        error_text = elem.text
-                        if error_text:
-                            errors_found.append(error_text)
-                            print(f"⚠️ Validation error: {error_text}")
-            except:
-                continue
+        # One script call for all selectors; find_elements would wait out the implicit wait per miss
+        errors_found = [s.text for s in displayed(snapshot(driver, error_selectors), min_text=1)]
+        for error_text in errors_found:
+            print(f"⚠️ Validation error: {error_text}")
         
         if errors_found:
             print(f"✅ Found {len(errors_found)} validation error(s)")
@@ -419,19 +309,10 @@ class TestFunctionalFeatures:
             ]
             
             required_found = False
-            for selector in required_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    if elements:
-                        required_found = True
-                        print(f"✅ Found required field indicator: {selector}")
-                        break
-                except:
-                    continue
+            match = locate("required_indicator", required_selectors, visible=False, enabled=False)
+            if match:
+                required_found = True
+                print(f"✅ Found required field indicator: {match.selector}")
             
             if not required_found:
                 print("ℹ️ No validation errors or required indicators found")
@@ -0,0 +1 @@
+# Fast tests for the pure-Python helpers in utils/; no browser or app needed
@@ -0,0 +1,37 @@
+import pytest
+
+from utils.baseline import mann_whitney_u
+
+
+class TestMannWhitneyU:
+    """One-sided test that the recent samples are slower than the baseline"""
+
+    def test_empty_sample(self):
+        assert mann_whitney_u([], [1.0, 2.0]) == (None, 1.0)
+        assert mann_whitney_u([1.0], []) == (None, 1.0)
+
+    def test_known_value(self):
+        # U = 9 of 9; z = (9 - 4.5 - 0.5) / sqrt(9 / 12 * 7)
+        u, p = mann_whitney_u([4, 5, 6], [1, 2, 3])
+        assert u == 9
+        assert p == pytest.approx(0.0404, abs=1e-4)
+
+    def test_slower_recent_runs_are_significant(self):
+        baseline = [100 + i % 7 for i in range(20)]
+        recent = [130 + i for i in range(5)]
+        _, p = mann_whitney_u(recent, baseline)
+        assert p < 0.01
+
+    def test_faster_recent_runs_are_not(self):
+        baseline = [100 + i % 7 for i in range(20)]
+        recent = [70 + i for i in range(5)]
+        _, p = mann_whitney_u(recent, baseline)
+        assert p > 0.99
+
+    def test_ties_use_midranks(self):
+        u, _ = mann_whitney_u([2, 2], [2, 2])
+        assert u == 2.0
+
+    def test_all_values_tied(self):
+        _, p = mann_whitney_u([5, 5, 5], [5, 5, 5])
+        assert p == 1.0
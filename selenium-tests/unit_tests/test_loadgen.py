@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from utils.loadgen import EndpointStats, LatencyHistogram, LoadGenerator, parse_mix
+
+
+class TestLatencyHistogram:
+    """Log-bucketed percentiles"""
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+        assert histogram.summary()["mean_ms"] is None
+
+    def test_percentiles_within_bucket_resolution(self):
+        rng = random.Random(1)
+        samples = [rng.uniform(0.001, 0.5) for _ in range(5000)]
+        histogram = LatencyHistogram()
+        for seconds in samples:
+            histogram.record(seconds)
+
+        ordered = sorted(samples)
+        for p in (50, 95, 99):
+            exact = ordered[int(len(ordered) * p / 100) - 1] * 1000
+            assert histogram.percentile(p) == pytest.approx(exact, rel=0.02)
+        assert histogram.percentile(100) == pytest.approx(max(samples) * 1000)
+
+    def test_percentile_never_exceeds_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.010)
+        assert histogram.percentile(99) == pytest.approx(10.0)
+        assert histogram.summary()["max_ms"] == 10.0
+
+    def test_summary_counts_every_sample(self):
+        histogram = LatencyHistogram()
+        for ms in (1, 2, 2, 50):
+            histogram.record(ms / 1000)
+        summary = histogram.summary()
+        assert summary["count"] == 4
+        assert sum(summary["histogram"].values()) == 4
+        assert summary["mean_ms"] == pytest.approx(13.75)
+
+
+class TestEndpointStats:
+    def test_error_rate(self):
+        stats = EndpointStats()
+        stats.latency.record(0.01)
+        stats.errors["HTTP 500"] += 1
+        summary = stats.summary()
+        assert summary["errors"] == 1
+        assert summary["error_rate"] == 1.0
+        assert summary["error_breakdown"] == {"HTTP 500": 1}
+
+
+class TestOperationMix:
+    def test_parse_mix(self):
+        assert parse_mix("get:70,like:30") == {"get": 70.0, "like": 30.0}
+
+    def test_parse_mix_rejects_unknown_operations(self):
+        with pytest.raises(ValueError):
+            parse_mix("get:50,fetch:50")
+
+    def test_fallback_resolves_to_create(self):
+        generator = LoadGenerator("http://127.0.0.1:1", mix={"like": 100})
+        assert generator._resolve("like") == "create"
+        assert generator._resolve("get") == "get"
+        generator.ids.append("5f0000000000000000000000")
+        assert generator._resolve("like") == "like"
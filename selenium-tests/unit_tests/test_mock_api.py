@@ -0,0 +1,84 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from utils.mock_api import MockPostsServer, PostStore, is_valid_id
+
+
+@pytest.fixture
+def server():
+    server = MockPostsServer(port=0).start()
+    yield server
+    server.stop()
+
+
+def call(server, method, path="", payload=None, headers=None):
+    """(status, headers, body) of one request; JSON bodies are decoded"""
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(
+        f"{server.url}/posts{path}", data=data, method=method,
+        headers={"Content-Type": "application/json", **(headers or {})},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            status, head, raw = response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        status, head, raw = e.code, e.headers, e.read()
+    if head.get("Content-Type", "").startswith("application/json"):
+        return status, head, json.loads(raw)
+    return status, head, raw.decode("utf-8")
+
+
+class TestPostStore:
+    def test_object_ids_are_unique_and_valid(self):
+        store = PostStore()
+        ids = {store.object_id() for _ in range(1000)}
+        assert len(ids) == 1000
+        assert all(is_valid_id(post_id) for post_id in ids)
+
+    def test_cast_follows_the_schema(self):
+        cast = PostStore.cast({"title": 5, "tags": "one", "unknown": "dropped"})
+        assert cast == {"title": "5", "tags": ["one"]}
+
+
+class TestPostsRoutes:
+    """Responses of server/controllers/posts.js"""
+
+    def test_create_list_update_like_delete(self, server):
+        status, _, created = call(server, "POST", payload={"title": "t", "message": "m", "tags": ["a"]})
+        assert status == 201
+        assert created["likeCount"] == 0 and created["tags"] == ["a"]
+        post_id = created["_id"]
+
+        assert [post["_id"] for post in call(server, "GET")[2]] == [post_id]
+        assert call(server, "PATCH", f"/{post_id}", {"title": "new"})[2]["title"] == "new"
+        assert call(server, "PATCH", f"/{post_id}/likePost")[2]["likeCount"] == 1
+        assert call(server, "DELETE", f"/{post_id}")[2] == {"message": "Post deleted successfully"}
+        assert call(server, "GET", f"/{post_id}")[2] is None
+
+    def test_malformed_ids_get_plain_text_404s(self, server):
+        status, _, body = call(server, "PATCH", "/not-an-id")
+        assert status == 404
+        assert body == "No post with id: not-an-id"
+
+    def test_unrouted_requests_get_express_404(self, server):
+        status, _, body = call(server, "PUT", "")
+        assert status == 404
+        assert "Cannot PUT /posts" in body
+
+    def test_invalid_json_is_a_400(self, server):
+        request = urllib.request.Request(
+            f"{server.url}/posts", data=b"{broken", method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request, timeout=5)
+        assert error.value.code == 400
+
+    def test_preflight_answers_like_cors(self, server):
+        status, headers, _ = call(server, "OPTIONS", headers={"Access-Control-Request-Headers": "content-type"})
+        assert status == 204
+        assert headers["Access-Control-Allow-Origin"] == "*"
+        assert headers["Access-Control-Allow-Headers"] == "content-type"
@@ -0,0 +1,84 @@
+import io
+
+import pytest
+
+from utils import visual
+from utils.visual import Image, np
+
+pytestmark = pytest.mark.skipif(not visual.available(), reason="Visual checks need numpy and Pillow")
+
+
+def png(pixels):
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def page(height=96, width=128):
+    """A grey page with a horizontal gradient, so tiles have structure"""
+    pixels = np.full((height, width, 3), 180, dtype=np.uint8)
+    pixels[:, :, 0] = np.linspace(0, 255, width, dtype=np.uint8)
+    return pixels
+
+
+class TestTileDiff:
+    def test_identical_images_have_no_changed_tiles(self):
+        assert not visual.changed_tiles(page(), page()).any()
+
+    def test_change_is_confined_to_its_tile(self):
+        changed = page()
+        changed[40:44, 70:74] = (0, 0, 0)
+        tiles = visual.changed_tiles(changed, page())
+        assert tiles.shape == (3, 4)
+        assert list(zip(*np.nonzero(tiles))) == [(1, 2)]
+
+    def test_flat_colour_change_is_caught_by_the_mean(self):
+        golden = np.full((32, 32, 3), 100, dtype=np.uint8)
+        assert visual.changed_tiles(golden + 20, golden).all()
+
+    def test_pixel_diff_respects_tolerance(self):
+        golden = page()
+        actual = golden.copy()
+        actual[0:32, 0:32, 1] += 10
+        actual[5, 5] = (255, 255, 255)
+        tiles = visual.changed_tiles(actual, golden)
+        diff = visual.pixel_diff(actual, golden, tiles, tolerance=24)
+        assert diff.sum() == 1 and diff[5, 5]
+
+
+class TestCompare:
+    def test_update_writes_golden_with_its_masks(self, tmp_path):
+        result = visual.compare(png(page()), "home", [[0, 0, 10, 10]], golden_dir=tmp_path, output_dir=tmp_path,
+                                update=True)
+        assert result.passed and "updated" in result.message
+        assert visual.load_masks(str(tmp_path / "home.png")) == [[0, 0, 10, 10]]
+
+    def test_missing_golden_fails_without_creating_one(self, tmp_path):
+        golden_dir, output_dir = tmp_path / "golden", tmp_path / "out"
+        result = visual.compare(png(page()), "home", golden_dir=golden_dir, output_dir=output_dir, update=False)
+        assert not result.passed
+        assert not golden_dir.exists()
+        assert (output_dir / "home_actual.png").exists()
+
+    def test_golden_masks_cover_content_that_moved(self, tmp_path):
+        before = page()
+        before[10:30, 10:30] = (0, 0, 0)
+        visual.compare(png(before), "home", [[8, 8, 24, 24]], golden_dir=tmp_path, output_dir=tmp_path, update=True)
+
+        after = page()
+        after[60:80, 60:80] = (0, 0, 0)
+        result = visual.compare(png(after), "home", [[58, 58, 24, 24]], golden_dir=tmp_path, output_dir=tmp_path)
+        assert result.passed, result.message
+
+    def test_unmasked_change_fails(self, tmp_path):
+        visual.compare(png(page()), "home", golden_dir=tmp_path, output_dir=tmp_path, update=True)
+        after = page()
+        after[60:80, 60:80] = (0, 0, 0)
+        result = visual.compare(png(after), "home", golden_dir=tmp_path, output_dir=tmp_path)
+        assert not result.passed
+        assert result.diff_path and (tmp_path / "home_diff.png").exists()
+
+    def test_size_change_fails(self, tmp_path):
+        visual.compare(png(page()), "home", golden_dir=tmp_path, output_dir=tmp_path, update=True)
+        result = visual.compare(png(page(width=96)), "home", golden_dir=tmp_path, output_dir=tmp_path)
+        assert not result.passed and "size" in result.message
@@ -0,0 +1 @@
+# Shared helpers used by the test suite and the tooling scripts
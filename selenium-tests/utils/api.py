@@ -0,0 +1,93 @@
+"""
+HTTP client for the posts API (server/routes/posts.js).
+
+Used to seed and clean up test data directly through the Express routes
+instead of driving the form, over a pooled keep-alive connection.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import urllib3
+
+API_URL = os.getenv("API_URL", "http://localhost:5000")
+
+
+class ApiError(Exception):
+    """Non-2xx response from the posts API"""
+
+    def __init__(self, method, url, status, body):
+        super().__init__(f"{method} {url} returned {status}: {body[:200]}")
+        self.status = status
+        self.body = body
+
+
+class PostsApi:
+    """Thin client for the six /posts routes"""
+
+    def __init__(self, base_url=API_URL, pool_size=10, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.url = f"{self.base_url}/posts"
+        self.pool_size = pool_size
+        self.http = urllib3.PoolManager(
+            maxsize=pool_size,
+            block=True,
+            timeout=urllib3.Timeout(total=timeout),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+
+    def request(self, method, path="", payload=None):
+        url = f"{self.url}{path}"
+        body = json.dumps(payload) if payload is not None else None
+        response = self.http.request(method, url, body=body, retries=False)
+        text = response.data.decode("utf-8", "replace")
+        if not 200 <= response.status < 300:
+            raise ApiError(method, url, response.status, text)
+        try:
+            return json.loads(text) if text else None
+        except ValueError:
+            return text
+
+    def list_posts(self):
+        return self.request("GET")
+
+    def get_post(self, post_id):
+        return self.request("GET", f"/{post_id}")
+
+    def create_post(self, post):
+        return self.request("POST", payload=post)
+
+    def update_post(self, post_id, post):
+        return self.request("PATCH", f"/{post_id}", payload=post)
+
+    def like_post(self, post_id):
+        return self.request("PATCH", f"/{post_id}/likePost")
+
+    def delete_post(self, post_id):
+        return self.request("DELETE", f"/{post_id}")
+
+    def delete_many(self, post_ids):
+        """Delete posts concurrently over the connection pool; returns the number deleted"""
+        def _delete(post_id):
+            try:
+                self.delete_post(post_id)
+                return True
+            except (ApiError, urllib3.exceptions.HTTPError):
+                return False
+
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return sum(executor.map(_delete, post_ids))
+
+    def delete_tagged(self, tag):
+        """Bulk-delete every post carrying a tag; returns the number deleted"""
+        ids = [post["_id"] for post in self.list_posts() if tag in (post.get("tags") or [])]
+        return self.delete_many(ids)
+
+    def close(self):
+        self.http.clear()
+
+
+def run_tag(namespace):
+    """Tag that marks every record created by one run/worker"""
+    return f"run-{namespace}"
@@ -0,0 +1,292 @@
+"""
+Record and replay of the /posts backend through Chrome DevTools.
+
+API_MODE selects how the browser's calls to API_URL/posts are served:
+
+    live    straight to the Express backend (default)
+    record  to the backend, with every response appended to the recording
+    replay  answered from the recording by the harness; no backend needed
+
+Requests are paused with the CDP Fetch domain (Fetch.requestPaused) on a
+trio event loop in a background thread, one per browser tab. Recordings are
+stored HAR-style (log.entries[].request/response) in API_RECORDING. In
+replay mode successive requests for the same method and path get the
+recorded responses in order (the last one repeats); ids that were never
+recorded fall back to any response recorded for the same route. Every
+xdist worker saves its own exchanges into the same file under a lock.
+"""
+
+import base64
+import json
+import os
+import re
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import trio
+from selenium.webdriver.common.bidi import cdp
+
+from utils.api import API_URL
+from utils.mock_api import cors_headers
+from utils.shared_files import locked, write_json_atomic
+
+SUITE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_MODE = os.getenv("API_MODE", "live").lower()
+RECORDING_PATH = os.getenv("API_RECORDING", os.path.join(SUITE_DIR, "recordings", "posts.har.json"))
+MODES = ("live", "record", "replay")
+
+OBJECT_ID = re.compile(r"/[0-9a-fA-F]{24}(?=/|$)")
+# Decoded bodies are replayed, so the original framing headers no longer apply
+DROPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection", "keep-alive"}
+
+
+def route_of(path):
+    """/posts/<ObjectId>/likePost -> /posts/:id/likePost"""
+    return OBJECT_ID.sub("/:id", path)
+
+
+def _path(url):
+    parsed = urlparse(url)
+    return parsed.path + (f"?{parsed.query}" if parsed.query else "")
+
+
+def _key(entry):
+    return entry["request"]["method"], _path(entry["request"]["url"])
+
+
+def cdp_endpoint(caps):
+    """(major version, browser websocket URL) from the session capabilities"""
+    if caps.get("se:cdp"):  # Selenium Grid proxies CDP
+        version = caps.get("se:cdpVersion") or caps["browserVersion"]
+        return version.split(".")[0], caps["se:cdp"]
+    # A local chromedriver reports the browser's DevTools address instead
+    address = caps["goog:chromeOptions"]["debuggerAddress"]
+    with urllib.request.urlopen(f"http://{address}/json/version", timeout=5) as response:
+        info = json.load(response)
+    return info["Browser"].split("/")[1].split(".")[0], info["webSocketDebuggerUrl"]
+
+
+class ApiRecording:
+    """HAR-like store of /posts exchanges, indexed by method and path"""
+
+    def __init__(self, path=RECORDING_PATH, run=None):
+        self.path = path
+        self.run = run
+        self.entries = []
+        self.recorded = []
+        self._by_path = defaultdict(list)
+        self._by_route = defaultdict(list)
+        self._cursors = defaultdict(int)
+        self._lock = threading.Lock()
+        for entry in self._read():
+            self._index(entry)
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)["log"]["entries"]
+        except (OSError, ValueError, KeyError):
+            return []
+
+    def _index(self, entry):
+        method, path = _key(entry)
+        self.entries.append(entry)
+        self._by_path[(method, path)].append(entry)
+        self._by_route[(method, route_of(path))].append(entry)
+
+    def add(self, method, url, post_data, status, headers, body, encoding=None):
+        """Append one exchange (headers as (name, value) pairs)"""
+        content = {"size": len(body), "mimeType": dict(
+            (name.lower(), value) for name, value in headers
+        ).get("content-type", ""), "text": body}
+        if encoding:
+            content["encoding"] = encoding
+        entry = {
+            "startedDateTime": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "request": {"method": method, "url": url, "headers": []},
+            "response": {
+                "status": status,
+                "statusText": "",
+                "headers": [{"name": name, "value": value} for name, value in headers],
+                "content": content,
+            },
+        }
+        if post_data:
+            entry["request"]["postData"] = {"mimeType": "application/json", "text": post_data}
+        if self.run:
+            entry["comment"] = f"run {self.run}"
+        with self._lock:
+            self._index(entry)
+            self.recorded.append(entry)
+
+    def match(self, method, url):
+        """Next recorded response for this request, or None"""
+        path = _path(url)
+        with self._lock:
+            for key, index in (((method, path), self._by_path), ((method, route_of(path)), self._by_route)):
+                candidates = index.get(key)
+                if candidates:
+                    position = self._cursors[key]
+                    self._cursors[key] += 1
+                    return candidates[min(position, len(candidates) - 1)]
+        return None
+
+    def save(self):
+        """
+        Merge this session's exchanges into the file: older runs' exchanges
+        for the same method and path are replaced, those saved by other
+        workers of this run are kept.
+        """
+        if not self.recorded:
+            return 0
+        keys = {_key(e) for e in self.recorded}
+        this_run = f"run {self.run}" if self.run else None
+        with locked(self.path):
+            kept = [
+                e for e in self._read()
+                if _key(e) not in keys or (this_run and e.get("comment") == this_run)
+            ]
+            data = {"log": {
+                "version": "1.2",
+                "creator": {"name": "selenium-tests", "version": "1.0"},
+                "entries": kept + self.recorded,
+            }}
+            write_json_atomic(self.path, data, indent=1)
+        return len(self.recorded)
+
+
+class ApiInterceptor:
+    """Pause the current tab's /posts requests over CDP and record or replay them"""
+
+    def __init__(self, driver, mode=API_MODE, recording=None, api_url=API_URL):
+        self.driver = driver
+        self.mode = mode
+        self.recording = recording
+        self.url_pattern = f"{api_url.rstrip('/')}/posts*"
+        self.served = 0
+        self.misses = []
+        self.error = None
+        self._ready = threading.Event()
+        self._thread = None
+        self._token = None
+        self._scope = None
+
+    def start(self, timeout=10):
+        """Attach to the current tab; returns once Fetch interception is enabled"""
+        # The window handle is the DevTools target id of the tab
+        target_id = self.driver.current_window_handle
+        version, ws_url = cdp_endpoint(self.driver.caps)
+        self._thread = threading.Thread(
+            target=trio.run, args=(self._run, version, ws_url, target_id),
+            name="api-intercept", daemon=True,
+        )
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"Fetch interception not enabled after {timeout}s")
+        if self.error:
+            raise self.error
+        return self
+
+    def stop(self):
+        """Cancel the event loop and wait for the thread"""
+        if self._token and self._scope:
+            try:
+                trio.from_thread.run_sync(self._scope.cancel, trio_token=self._token)
+            except (trio.RunFinishedError, RuntimeError):
+                pass
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    async def _run(self, version, ws_url, target_id):
+        self._token = trio.lowlevel.current_trio_token()
+        try:
+            with trio.CancelScope() as self._scope:
+                devtools = cdp.import_devtools(version)
+                fetch = devtools.fetch
+                # Record sees the real response; replay never lets the request leave the browser
+                stage = fetch.RequestStage.RESPONSE if self.mode == "record" else fetch.RequestStage.REQUEST
+                async with cdp.open_cdp(ws_url) as connection:
+                    async with connection.open_session(devtools.target.TargetID(target_id)) as session:
+                        events = session.listen(fetch.RequestPaused, buffer_size=100)
+                        await session.execute(fetch.enable(patterns=[
+                            fetch.RequestPattern(url_pattern=self.url_pattern, request_stage=stage)
+                        ]))
+                        self._ready.set()
+                        async for event in events:
+                            await self._handle(session, fetch, event)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._ready.set()
+
+    async def _handle(self, session, fetch, event):
+        try:
+            if self.mode == "record":
+                await self._record(session, fetch, event)
+            else:
+                await self._replay(session, fetch, event)
+        except Exception as e:
+            print(f"⚠️  {self.mode} of {event.request.method} {event.request.url} failed: {e}")
+            try:
+                await session.execute(fetch.continue_request(event.request_id))
+            except Exception:
+                pass
+
+    async def _record(self, session, fetch, event):
+        request = event.request
+        if event.response_status_code is not None and request.method != "OPTIONS":
+            try:
+                body, encoded = await session.execute(fetch.get_response_body(event.request_id))
+            except Exception:
+                body, encoded = "", False  # 204s and redirects have no body
+            encoding = None
+            if encoded:
+                raw = base64.b64decode(body)
+                try:
+                    body = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    encoding = "base64"
+            headers = [(h.name, h.value) for h in event.response_headers or []]
+            self.recording.add(request.method, request.url, request.post_data,
+                               event.response_status_code, headers, body, encoding)
+            self.served += 1
+        await session.execute(fetch.continue_request(event.request_id))
+
+    async def _replay(self, session, fetch, event):
+        request = event.request
+        if request.method == "OPTIONS":
+            await self._fulfill(session, fetch, event, 204, cors_headers(request.headers), b"")
+            return
+
+        entry = self.recording.match(request.method, request.url)
+        if entry is None:
+            self.misses.append(f"{request.method} {_path(request.url)}")
+            print(f"⚠️  No recording for {request.method} {_path(request.url)}")
+            body = json.dumps({"message": f"No recording for {request.method} {_path(request.url)}"})
+            headers = [("Content-Type", "application/json; charset=utf-8")] + cors_headers()
+            await self._fulfill(session, fetch, event, 404, headers, body.encode("utf-8"))
+            return
+
+        response = entry["response"]
+        content = response.get("content", {})
+        text = content.get("text", "")
+        body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+        headers = [
+            (h["name"], h["value"]) for h in response.get("headers", [])
+            if h["name"].lower() not in DROPPED_HEADERS
+        ]
+        if not any(name.lower() == "access-control-allow-origin" for name, _ in headers):
+            headers += cors_headers()
+        await self._fulfill(session, fetch, event, response["status"], headers, body)
+        self.served += 1
+
+    async def _fulfill(self, session, fetch, event, status, headers, body):
+        await session.execute(fetch.fulfill_request(
+            event.request_id,
+            response_code=status,
+            response_headers=[fetch.HeaderEntry(name=name, value=value) for name, value in headers],
+            body=base64.b64encode(body).decode("ascii"),
+        ))
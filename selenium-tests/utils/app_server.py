@@ -0,0 +1,483 @@
+"""
+Startup orchestration for the MERN app under test.
+
+Launches the Express backend and the React dev server concurrently and
+polls health URLs (GET /posts on the backend, the dev server root on the
+frontend) with backoff, so tests start as soon as both actually answer
+instead of after a fixed delay.
+
+Process output is drained by background threads into rotating log files
+and a bounded in-memory ring buffer, so a chatty dev server can never fill
+its pipe and stall, and memory stays flat however long the run is.
+
+REUSE_SERVER=true attaches to an already-running healthy instance (tracked
+in a pidfile, and only if it was started with the same SERVE_BUILD and
+REACT_APP_API_URL) and leaves the app up after the run; SERVE_BUILD=true serves
+the production build of client/ instead of the webpack dev server.
+Run `python -m utils.app_server start|stop|status` to manage it by hand.
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from urllib.parse import urlparse
+
+SUITE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(SUITE_DIR)
+LOG_DIR = os.getenv("LOG_DIR", os.path.join(SUITE_DIR, "test-results", "logs"))
+PIDFILE = os.getenv("APP_PIDFILE", os.path.join(SUITE_DIR, ".mern_app.pid"))
+
+BACKEND_URL = os.getenv("API_URL", "http://localhost:5000")
+FRONTEND_URL = os.getenv("APP_URL", "http://localhost:3000")
+START_TIMEOUT = float(os.getenv("APP_START_TIMEOUT", "120"))
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", "3"))
+LOG_RING_LINES = int(os.getenv("LOG_RING_LINES", "200"))
+MAX_LINE_BYTES = 64 * 1024
+
+REUSE_SERVER = os.getenv("REUSE_SERVER", "false").lower() == "true"
+SERVE_BUILD = os.getenv("SERVE_BUILD", "false").lower() == "true"
+
+
+def find_app_dir(env_var, names):
+    """First existing directory among $env_var and REPO_ROOT/<name>"""
+    candidates = [os.getenv(env_var)] + [os.path.join(REPO_ROOT, name) for name in names]
+    for path in filter(None, candidates):
+        if os.path.isdir(path):
+            return path
+    return None
+
+
+def tail_file(path, lines=LOG_RING_LINES):
+    """Last lines of a (rotated, hence size-bounded) log file"""
+    try:
+        with open(path, errors="replace") as f:
+            return "".join(deque(f, maxlen=lines))
+    except OSError:
+        return ""
+
+
+def rotate_log(path, backups=LOG_BACKUPS):
+    """Shift path -> path.1 -> ... -> path.<backups>, so a new run starts an empty log"""
+    if not os.path.exists(path):
+        return
+    if backups < 1:
+        os.remove(path)
+        return
+    for index in range(backups - 1, 0, -1):
+        if os.path.exists(f"{path}.{index}"):
+            os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def newest_mtime(paths):
+    """Most recent modification time of any file below the given paths"""
+    newest = 0
+    for path in paths:
+        if os.path.isfile(path):
+            newest = max(newest, os.path.getmtime(path))
+        for root, _, files in os.walk(path):
+            for name in files:
+                newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+    return newest
+
+
+def built_api_url(build_dir):
+    """REACT_APP_API_URL the build was made with (it is compiled into the bundle)"""
+    try:
+        with open(os.path.join(build_dir, ".api_url")) as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def ensure_client_build(client_dir):
+    """Run `npm run build` unless client/build is newer than the sources; returns the build dir"""
+    build_dir = os.path.join(client_dir, "build")
+    index = os.path.join(build_dir, "index.html")
+    sources = [os.path.join(client_dir, name) for name in ("src", "public", "package.json")]
+    api_url = os.getenv("REACT_APP_API_URL", "")
+    if (os.path.exists(index) and os.path.getmtime(index) >= newest_mtime(sources)
+            and built_api_url(build_dir) == api_url):
+        print(f"📦 Reusing production build: {build_dir}")
+        return build_dir
+
+    print(f"📦 Building client for production in {client_dir}...")
+    os.makedirs(LOG_DIR, exist_ok=True)
+    with open(os.path.join(LOG_DIR, "build.log"), "wb") as log:
+        subprocess.run(
+            ["npm", "run", "build"], cwd=client_dir, stdout=log, stderr=subprocess.STDOUT,
+            shell=os.name == "nt", check=True,
+        )
+    with open(os.path.join(build_dir, ".api_url"), "w") as f:
+        f.write(api_url)
+    return build_dir
+
+
+def kill_process_group(pid):
+    """Terminate a process started by ManagedProcess (and its children)"""
+    try:
+        if os.name == "nt":
+            os.kill(pid, signal.SIGTERM)
+        else:
+            os.killpg(pid, signal.SIGTERM)
+        return True
+    except OSError:
+        return False
+
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+
+def is_healthy(url, timeout=2):
+    """True if url answers with a 2xx status"""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return 200 <= response.status < 300
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
+
+
+class ManagedProcess:
+    """
+    An `npm start` process with drained output, a log file and a health URL.
+
+    A detached process writes straight to its log file instead of a pipe, so
+    it keeps running after the test process exits (reuse mode).
+    """
+
+    def __init__(self, name, cwd, health_url, env=None, command=("npm", "start"), detached=False):
+        self.name = name
+        self.cwd = cwd
+        self.health_url = health_url
+        self.env = env or {}
+        self.command = list(command)
+        self.detached = detached
+        self.log_path = os.path.join(LOG_DIR, f"{name}.log")
+        self.ring = deque(maxlen=LOG_RING_LINES)
+        self.process = None
+        self._logger = None
+        self._readers = []
+
+    def _open_log(self):
+        os.makedirs(LOG_DIR, exist_ok=True)
+        handler = RotatingFileHandler(
+            self.log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger = logging.getLogger(f"mern_app.{self.name}")
+        logger.handlers = [handler]
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        return logger
+
+    def _drain(self, stream, label):
+        """Reader thread: copy one pipe into the log file and the ring buffer"""
+        for raw in iter(lambda: stream.readline(MAX_LINE_BYTES), b""):
+            line = f"[{label}] {raw.decode('utf-8', 'replace').rstrip()}"
+            self.ring.append(line)
+            self._logger.info(line)
+        stream.close()
+
+    def start(self):
+        windows = os.name == "nt"
+        if self.detached:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            # Nothing drains a detached process's output, so the size is bounded per run instead
+            rotate_log(self.log_path)
+            with open(self.log_path, "wb") as log:
+                self.process = subprocess.Popen(
+                    self.command,
+                    cwd=self.cwd,
+                    env={**os.environ, **self.env},
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    shell=windows,
+                    start_new_session=not windows,
+                )
+            print(f"🚀 Started {self.name} (pid {self.process.pid}, detached) from {self.cwd}, logging to {self.log_path}")
+            return
+
+        self._logger = self._open_log()
+        self.process = subprocess.Popen(
+            self.command,
+            cwd=self.cwd,
+            env={**os.environ, **self.env},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            shell=windows,  # npm is npm.cmd on Windows
+            start_new_session=not windows,
+        )
+        self._readers = [
+            threading.Thread(target=self._drain, args=(stream, label), daemon=True,
+                             name=f"{self.name}-{label}-reader")
+            for stream, label in ((self.process.stdout, "stdout"), (self.process.stderr, "stderr"))
+        ]
+        for reader in self._readers:
+            reader.start()
+        print(f"🚀 Started {self.name} (pid {self.process.pid}) from {self.cwd}, logging to {self.log_path}")
+
+    def exited(self):
+        return self.process is not None and self.process.poll() is not None
+
+    def recent_output(self, lines=LOG_RING_LINES):
+        if self.detached:
+            return tail_file(self.log_path, lines)
+        return "\n".join(list(self.ring)[-lines:])
+
+    def log_tail(self, lines=20):
+        return self.recent_output(lines)
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            try:
+                if os.name == "nt":
+                    self.process.terminate()
+                else:
+                    # npm spawns children (node, webpack); stop the whole group
+                    os.killpg(self.process.pid, signal.SIGTERM)
+                self.process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+            print(f"✅ {self.name.capitalize()} stopped")
+        for reader in self._readers:
+            reader.join(timeout=2)
+        self._readers = []
+        if self._logger:
+            for handler in self._logger.handlers:
+                handler.close()
+            self._logger.handlers = []
+
+
+class MernApp:
+    """Backend + frontend started together and awaited through health probes"""
+
+    def __init__(self, backend_url=BACKEND_URL, frontend_url=FRONTEND_URL,
+                 reuse=REUSE_SERVER, serve_build=SERVE_BUILD, backend=True):
+        self.backend_url = backend_url
+        self.frontend_url = frontend_url
+        self.reuse = reuse
+        self.serve_build = serve_build
+        self.backend = backend
+        self.services = []
+        self.probes = {
+            "backend": f"{backend_url}/posts",
+            "frontend": frontend_url,
+        }
+        if not backend:  # API_MODE=replay answers /posts from a recording
+            del self.probes["backend"]
+
+    def start(self, timeout=START_TIMEOUT):
+        """Launch both processes and block until both health probes pass"""
+        print("\n" + "="*60)
+        print("STARTING MERN MEMORIES APPLICATION")
+        print("="*60)
+
+        if self.reuse and self.attach():
+            print("="*60 + "\n")
+            return True
+
+        start = time.monotonic()
+        self.services = self.build_services()
+        if not self.services:
+            # e.g. the Docker image, which only holds the suite: the app runs elsewhere
+            print("⏭️  No app directories here, not waiting for the health probes")
+            print("="*60 + "\n")
+            return True
+        for service in self.services:
+            service.start()
+
+        # Only what was launched here is awaited; a missing directory must not cost the full timeout
+        probes = {service.name: self.probes[service.name] for service in self.services}
+        ready = self.wait_until_ready(probes, timeout)
+        elapsed = time.monotonic() - start
+        if ready:
+            print(f"✅ {' and '.join(probes).capitalize()} ready in {elapsed:.1f}s")
+            if self.reuse:
+                self.write_pidfile()
+        else:
+            print(f"❌ App not ready after {elapsed:.1f}s")
+            for service in self.services:
+                print(f"--- last lines of {service.log_path} ---\n{service.log_tail()}")
+        print("="*60 + "\n")
+        return ready
+
+    def build_services(self):
+        """The processes to launch for this configuration"""
+        services = []
+        backend_dir = find_app_dir("BACKEND_DIR", ["backend", "server"])
+        if not self.backend:
+            source = "MOCK_API=true" if os.getenv("MOCK_API", "false").lower() == "true" else "API_MODE=replay"
+            print(f"⏭️  Backend not started ({source})")
+        elif backend_dir:
+            services.append(ManagedProcess(
+                "backend", backend_dir, self.probes["backend"], detached=self.reuse
+            ))
+        else:
+            print("⚠️  Backend directory not found")
+
+        frontend_dir = find_app_dir("FRONTEND_DIR", ["frontend", "client"])
+        if not frontend_dir:
+            print("⚠️  Frontend directory not found")
+        elif self.serve_build:
+            build_dir = ensure_client_build(frontend_dir)
+            port = str(urlparse(self.frontend_url).port or 80)
+            services.append(ManagedProcess(
+                "frontend", SUITE_DIR, self.probes["frontend"],
+                command=(sys.executable, "-m", "utils.static_server", build_dir, "--port", port),
+                detached=self.reuse,
+            ))
+        else:
+            services.append(ManagedProcess(
+                "frontend", frontend_dir, self.probes["frontend"],
+                env={"BROWSER": "none", "CI": "true"}, detached=self.reuse,
+            ))
+        return services
+
+    def read_pidfile(self):
+        try:
+            with open(PIDFILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def settings(self):
+        """What a reused instance must have been started with"""
+        return {"serve_build": self.serve_build, "api_url": os.getenv("REACT_APP_API_URL", "")}
+
+    def write_pidfile(self):
+        data = {
+            "pids": {service.name: service.process.pid for service in self.services},
+            "probes": self.probes,
+            **self.settings(),
+            "started_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with open(PIDFILE, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def attach(self):
+        """Reuse an already-running healthy instance; clear a stale or mismatched one"""
+        info = self.read_pidfile()
+        mismatched = {
+            key: (info.get(key), value) for key, value in self.settings().items()
+            if info and info.get(key) != value
+        }
+        if mismatched:
+            changes = ", ".join(f"{key} {old!r} -> {new!r}" for key, (old, new) in mismatched.items())
+            print(f"🧹 Running app was started with different settings ({changes}), restarting it")
+            self.kill_pidfile_processes(info)
+            return False
+        if all(is_healthy(url) for url in self.probes.values()):
+            owner = f"pids {info['pids']}" if info else "not started by this suite"
+            print(f"♻️  Attached to running app ({owner})")
+            return True
+        if info:
+            print("🧹 Pidfile points to an unhealthy app, restarting it")
+            self.kill_pidfile_processes(info)
+        return False
+
+    def kill_pidfile_processes(self, info, timeout=10):
+        """Stop the processes of a previous reuse-mode run and wait until they are gone"""
+        pids = [pid for pid in info.get("pids", {}).values() if kill_process_group(pid)]
+        deadline = time.monotonic() + timeout
+        while pids and time.monotonic() < deadline:
+            time.sleep(0.1)
+            pids = [pid for pid in pids if process_alive(pid)]
+        os.remove(PIDFILE)
+
+    def wait_until_ready(self, probes, timeout):
+        """Poll every probe with exponential backoff until all pass or time runs out"""
+        deadline = time.monotonic() + timeout
+        pending = dict(probes)
+        delay = 0.1
+        while pending:
+            for name, url in list(pending.items()):
+                if is_healthy(url):
+                    print(f"💚 {name.capitalize()} healthy: {url}")
+                    del pending[name]
+
+            crashed = [s for s in self.services if s.name in pending and s.exited()]
+            for service in crashed:
+                print(f"❌ {service.name.capitalize()} exited with code {service.process.returncode}")
+            if crashed or not pending:
+                break
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+        return not pending
+
+    def recent_output(self):
+        """{service name: recent output} from the in-memory ring buffers"""
+        if not self.services:
+            return recent_output_from_logs()
+        return {service.name: service.recent_output() for service in self.services}
+
+    def stop(self, force=False):
+        """Stop the app; in reuse mode it is left running unless forced"""
+        print("\n" + "="*60)
+        print("STOPPING MERN MEMORIES APPLICATION")
+        print("="*60)
+        if self.reuse and not force:
+            print("♻️  Leaving app running for the next run (stop it with: python -m utils.app_server stop)")
+        else:
+            for service in reversed(self.services):
+                service.stop()
+            info = self.read_pidfile()
+            if force and info:
+                for name, pid in info.get("pids", {}).items():
+                    if kill_process_group(pid):
+                        print(f"✅ {name.capitalize()} stopped (pid {pid})")
+                os.remove(PIDFILE)
+        self.services = []
+        print("="*60)
+
+
+def recent_output_from_logs():
+    """
+    {service name: recent output} read from the log files.
+
+    Used where the app runs in another process (e.g. an xdist worker while
+    the controller owns the servers).
+    """
+    return {
+        os.path.splitext(os.path.basename(path))[0]: tail_file(path)
+        for path in sorted(glob.glob(os.path.join(LOG_DIR, "*.log")))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the long-lived MERN app used by the tests")
+    parser.add_argument("action", choices=["start", "stop", "status"])
+    args = parser.parse_args()
+
+    app = MernApp(reuse=True)
+    if args.action == "start":
+        return 0 if app.start() else 1
+    if args.action == "stop":
+        app.stop(force=True)
+        return 0
+    healthy = {name: is_healthy(url) for name, url in app.probes.items()}
+    print(json.dumps({"pidfile": app.read_pidfile(), "healthy": healthy}, indent=2))
+    return 0 if all(healthy.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
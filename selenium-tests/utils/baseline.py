@@ -0,0 +1,197 @@
+"""
+Performance history and regression detection across runs.
+
+Every passing test appends its duration and per-visit browser metrics to a
+SQLite store under test-results/. A test's most recent runs are compared
+with the rolling baseline of the runs before them using a one-sided
+Mann-Whitney U test, so a single noisy run doesn't raise a flag but a
+sustained slowdown does.
+Run `python -m utils.baseline <test nodeid>` to see a test's history per commit.
+"""
+
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+SUITE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Anchored to the suite, so runs started from the repo root share the same history
+HISTORY_PATH = os.getenv("PERF_HISTORY", os.path.join(SUITE_DIR, "test-results", "perf_history.sqlite"))
+RECENT_RUNS = int(os.getenv("PERF_RECENT_RUNS", "5"))
+BASELINE_RUNS = int(os.getenv("PERF_BASELINE_RUNS", "20"))
+ALPHA = float(os.getenv("PERF_ALPHA", "0.05"))
+MIN_CHANGE = float(os.getenv("PERF_MIN_CHANGE", "0.10"))  # ignore significant but tiny shifts
+
+# Browser metrics kept per visit (see utils/perf_metrics.py); lower is better for all of them
+VISIT_METRICS = (
+    "ttfb_ms", "fcp_ms", "lcp_ms", "dom_content_loaded_ms", "load_ms",
+    "long_task_total_ms", "js_heap_mb", "layout_count", "script_duration_ms",
+)
+
+Regression = namedtuple("Regression", ["test", "metric", "baseline", "recent", "change", "p_value"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    run_id TEXT NOT NULL,
+    git_commit TEXT,
+    test TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_test_metric ON samples (test, metric, recorded_at);
+"""
+
+
+def current_commit():
+    """Short hash of the checked-out commit (GIT_COMMIT wins, e.g. in CI)"""
+    if os.getenv("GIT_COMMIT"):
+        return os.environ["GIT_COMMIT"][:12]
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _normal_sf(z):
+    """P(Z > z) for a standard normal variable"""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def mann_whitney_u(recent, baseline):
+    """
+    One-sided Mann-Whitney U test that `recent` is stochastically greater
+    than `baseline`. Returns (U, p) using the normal approximation with tie
+    and continuity corrections.
+    """
+    n1, n2 = len(recent), len(baseline)
+    if not n1 or not n2:
+        return None, 1.0
+
+    # Midranks over the pooled sample
+    pooled = sorted([(value, 0) for value in recent] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, pooled) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, _normal_sf(z)
+
+
+class BaselineStore:
+    """SQLite time series of per-test metrics"""
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # xdist workers write to the same file; wait for each other's locks
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.executescript(SCHEMA)
+
+    def record(self, run_id, commit, test, samples):
+        """Append (metric, value) samples for one test in one run"""
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, commit, test, metric, float(value), now) for metric, value in samples],
+            )
+
+    def runs(self, test, metric, limit):
+        """The last `limit` runs of a test metric, newest first: [(run_id, [values])]"""
+        rows = self.db.execute(
+            """SELECT run_id, value FROM samples
+               WHERE test = ? AND metric = ? AND run_id IN (
+                   SELECT run_id FROM samples WHERE test = ? AND metric = ?
+                   GROUP BY run_id ORDER BY MAX(recorded_at) DESC LIMIT ?)
+               ORDER BY recorded_at DESC""",
+            (test, metric, test, metric, limit),
+        ).fetchall()
+        runs = {}
+        for run_id, value in rows:
+            runs.setdefault(run_id, []).append(value)
+        return list(runs.items())
+
+    def metrics(self, test):
+        return [row[0] for row in self.db.execute(
+            "SELECT DISTINCT metric FROM samples WHERE test = ? ORDER BY metric", (test,)
+        )]
+
+    def detect(self, test, metrics=None, recent_runs=RECENT_RUNS, baseline_runs=BASELINE_RUNS,
+               alpha=ALPHA, min_change=MIN_CHANGE):
+        """Regressions where the last recent_runs are slower than the baseline_runs before them"""
+        regressions = []
+        for metric in metrics or self.metrics(test):
+            runs = self.runs(test, metric, recent_runs + baseline_runs)
+            # One value per run (the median of its visits) keeps runs equally weighted
+            per_run = [statistics.median(values) for _, values in runs]
+            recent, baseline = per_run[:recent_runs], per_run[recent_runs:]
+            if len(recent) < recent_runs or len(baseline) < max(3, recent_runs):
+                continue
+            _, p_value = mann_whitney_u(recent, baseline)
+            baseline_median = statistics.median(baseline)
+            recent_median = statistics.median(recent)
+            change = (recent_median - baseline_median) / baseline_median if baseline_median else 0.0
+            if p_value < alpha and change > min_change:
+                regressions.append(Regression(test, metric, baseline_median, recent_median, change, p_value))
+        return regressions
+
+    def by_commit(self, test, metric):
+        """Median and sample count per commit, oldest first"""
+        rows = self.db.execute(
+            """SELECT git_commit, value, recorded_at FROM samples
+               WHERE test = ? AND metric = ? ORDER BY recorded_at""",
+            (test, metric),
+        ).fetchall()
+        commits = {}
+        for commit, value, _ in rows:
+            commits.setdefault(commit or "unknown", []).append(value)
+        return [(commit, statistics.median(values), len(values)) for commit, values in commits.items()]
+
+    def close(self):
+        self.db.close()
+
+
+def collect_samples(duration, visits):
+    """(metric, value) pairs for a test: its call duration plus per-route visit metrics"""
+    samples = [("duration_s", duration)]
+    for visit in visits or []:
+        for key in VISIT_METRICS:
+            if visit.get(key) is not None:
+                samples.append((f"{visit['route']} {key}", visit[key]))
+    return samples
+
+
+def format_regression(regression):
+    return (f"{regression.metric}: {regression.baseline:.4g} -> {regression.recent:.4g} "
+            f"(+{regression.change:.0%}, p={regression.p_value:.3f})")
+
+
+if __name__ == "__main__":
+    store = BaselineStore()
+    for test in sys.argv[1:]:
+        print(test)
+        for metric in store.metrics(test):
+            history = ", ".join(f"{commit} {median:.1f} (n={n})" for commit, median, n in store.by_commit(test, metric))
+            print(f"  {metric}: {history}")
@@ -0,0 +1,143 @@
+"""
+Per-command timing for WebDriver.
+
+Every WebDriver command (driver methods, element methods, waits polling
+find_element, CDP calls) goes through driver.execute, so wrapping it on
+the instance times all of them. Element commands are labelled with the
+selector that found the element, which makes locator misses and slow
+implicit waits stand out in the per-test timeline.
+"""
+
+import heapq
+import time
+from html import escape
+
+from selenium.webdriver.remote.command import Command
+
+FIND_COMMANDS = {
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+}
+SCRIPT_COMMANDS = {Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC}
+MAX_TIMELINE_ROWS = 400
+
+
+def _element_id(value):
+    """W3C element reference -> id"""
+    if isinstance(value, dict):
+        return next((v for k, v in value.items() if k.startswith("element-")), None)
+    return getattr(value, "id", None)
+
+
+class CommandTimer:
+    """Record (start, duration, command, target) for every command the driver sends"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.events = []
+        self.started = time.perf_counter()
+        self._selectors = {}
+        self._execute = driver.execute
+        driver.execute = self.execute
+
+    def reset(self):
+        """Start a new timeline (one per test)"""
+        self.events = []
+        self.started = time.perf_counter()
+        self._selectors = {}
+
+    def _target(self, command, params):
+        if command in FIND_COMMANDS:
+            return f"{params.get('using')}={params.get('value')}"
+        if command in SCRIPT_COMMANDS:
+            return " ".join(str(params.get("script", "")).split())[:80]
+        if command == Command.GET:
+            return params.get("url")
+        if command == "executeCdpCommand":
+            return params.get("cmd")
+        element_id = params.get("id") or params.get("elementId")
+        return self._selectors.get(element_id, "") if element_id else ""
+
+    def _remember(self, command, params, response):
+        """Map returned element ids to the selector that found them"""
+        if command not in FIND_COMMANDS or not response:
+            return
+        value = response.get("value")
+        selector = self._target(command, params)
+        for element in value if isinstance(value, list) else [value]:
+            element_id = _element_id(element)
+            if element_id:
+                self._selectors[element_id] = selector
+
+    def execute(self, driver_command, params=None):
+        start = time.perf_counter()
+        error = None
+        try:
+            response = self._execute(driver_command, params)
+            self._remember(driver_command, params or {}, response)
+            return response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.events.append({
+                "start_ms": round((start - self.started) * 1000, 1),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                "command": driver_command,
+                "target": self._target(driver_command, params or {}),
+                "error": error,
+            })
+
+
+def slowest(events, count=10):
+    """The `count` slowest events"""
+    return heapq.nlargest(count, events, key=lambda event: event["duration_ms"])
+
+
+def summarize(events):
+    """Total time and count per command type, slowest first"""
+    totals = {}
+    for event in events:
+        total = totals.setdefault(event["command"], {"command": event["command"], "count": 0, "total_ms": 0.0})
+        total["count"] += 1
+        total["total_ms"] += event["duration_ms"]
+    return sorted(totals.values(), key=lambda total: total["total_ms"], reverse=True)
+
+
+def timeline_html(events):
+    """Waterfall of every command, scaled to the test's duration"""
+    if not events:
+        return ""
+    end = max(event["start_ms"] + event["duration_ms"] for event in events) or 1
+    shown = events if len(events) <= MAX_TIMELINE_ROWS else slowest(events, MAX_TIMELINE_ROWS)
+    rows = []
+    for event in sorted(shown, key=lambda event: event["start_ms"]):
+        left = event["start_ms"] / end * 100
+        width = max(event["duration_ms"] / end * 100, 0.2)
+        color = "#d9534f" if event["error"] else "#5b9bd5"
+        label = escape(f"{event['command']} {event['target'] or ''}".strip())
+        rows.append(
+            f'<div style="display:flex;font:11px monospace;line-height:14px" '
+            f'title="{label} ({event["duration_ms"]} ms @ {event["start_ms"]} ms)">'
+            f'<div style="width:35%;overflow:hidden;white-space:nowrap;text-overflow:ellipsis">{label}</div>'
+            f'<div style="width:65%;position:relative"><div style="position:absolute;left:{left:.2f}%;'
+            f'width:{width:.2f}%;height:10px;top:2px;background:{color}"></div></div></div>'
+        )
+    totals = ", ".join(f"{t['command']} {t['total_ms']:.0f} ms ×{t['count']}" for t in summarize(events)[:6])
+    return (
+        f"<details><summary>WebDriver timeline: {len(events)} commands over {end / 1000:.1f}s "
+        f"({escape(totals)})</summary>{''.join(rows)}</details>"
+    )
+
+
+def slowest_table_html(entries, title="Slowest WebDriver commands"):
+    """Table of (test, event) pairs"""
+    rows = "".join(
+        f"<tr><td>{event['duration_ms']:.0f}</td><td>{escape(event['command'])}</td>"
+        f"<td>{escape(event['target'] or '')}</td><td>{escape(test)}</td></tr>"
+        for test, event in entries
+    )
+    return (
+        f"<h2>{title}</h2><table><tr><th>ms</th><th>command</th><th>selector/target</th>"
+        f"<th>test</th></tr>{rows}</table>"
+    )
@@ -0,0 +1,159 @@
+"""
+Synthetic post datasets for scale testing the posts list.
+
+Generates realistic-looking memories (varied title/message lengths, a
+skewed tag distribution, optional base64 PNG images of configurable size)
+and loads them concurrently through the /posts API or straight into
+MongoDB.
+"""
+
+import base64
+import datetime
+import random
+import struct
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+WORDS = (
+    "beach sunset family trip mountain hike city night friends birthday "
+    "wedding graduation road coffee forest lake snow summer winter autumn "
+    "spring concert festival museum garden river picnic camping market "
+    "dinner breakfast train flight island bridge castle harbor desert"
+).split()
+
+TAG_POOL = (
+    "travel family friends food nature city holiday summer winter party "
+    "music art sport pets beach hiking sunset throwback weekend photography"
+).split()
+
+# Default image mix: size in bytes -> probability
+DEFAULT_IMAGE_MIX = {0: 0.4, 20_000: 0.35, 150_000: 0.2, 600_000: 0.05}
+
+MONGO_COLLECTION = "postmessages"  # mongoose pluralizes the PostMessage model
+
+
+def make_png(target_bytes, rng):
+    """A noise PNG whose encoded size is close to target_bytes"""
+    # Random pixels don't compress, so ~3 bytes per RGB pixel
+    side = max(1, int((target_bytes / 3) ** 0.5))
+    raw = b"".join(b"\x00" + rng.randbytes(side * 3) for _ in range(side))
+
+    def chunk(kind, data):
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b""))
+
+
+def image_data_url(target_bytes, rng):
+    """data: URL as produced by react-file-base64 in Form.js"""
+    if not target_bytes:
+        return ""
+    encoded = base64.b64encode(make_png(target_bytes, rng)).decode("ascii")
+    return f"data:image/png;base64,{encoded}"
+
+
+def parse_image_mix(spec):
+    """'0:0.5,20000:0.3,200000:0.2' -> {0: 0.5, 20000: 0.3, 200000: 0.2}"""
+    mix = {}
+    for part in spec.split(","):
+        size, weight = part.split(":")
+        mix[int(size)] = float(weight)
+    return mix
+
+
+def _sentence(rng, min_words, max_words):
+    words = rng.choices(WORDS, k=rng.randint(min_words, max_words))
+    return " ".join(words).capitalize()
+
+
+def generate_post(rng, tags=(), image_mix=None):
+    """One synthetic post in the shape createPost expects"""
+    image_mix = image_mix or DEFAULT_IMAGE_MIX
+    # Skewed (Zipf-like) tag popularity: the first tags are far more common
+    weights = [1 / (rank + 1) for rank in range(len(TAG_POOL))]
+    post_tags = sorted(set(rng.choices(TAG_POOL, weights=weights, k=rng.randint(0, 4))))
+    image_size = rng.choices(list(image_mix), weights=list(image_mix.values()))[0]
+    return {
+        "title": _sentence(rng, 1, 12),
+        "message": ". ".join(_sentence(rng, 3, 25) for _ in range(rng.randint(1, 6))) + ".",
+        "creator": rng.choice(["alice", "bob", "carol", "dave", "erin", "selenium"]),
+        "tags": post_tags + list(tags),
+        "selectedFile": image_data_url(image_size, rng),
+    }
+
+
+def generate_posts(count, seed=0, tags=(), image_mix=None):
+    """Yield count posts; the same seed always gives the same dataset"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield generate_post(rng, tags, image_mix)
+
+
+def load_via_api(api, posts, concurrency=10):
+    """
+    POST every post concurrently; returns the created ids. If a create
+    fails, nothing more is submitted and the posts created so far are
+    deleted again before the first error is raised.
+    """
+    ids = []
+    errors = []
+    in_flight = set()
+
+    def _collect(done):
+        for future in done:
+            try:
+                ids.append(future.result()["_id"])
+            except Exception as e:
+                errors.append(e)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for post in posts:
+            # Bound the backlog so large image datasets are never all in memory
+            if len(in_flight) >= concurrency * 2:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                _collect(done)
+            if errors:
+                break
+            in_flight.add(executor.submit(api.create_post, post))
+        _collect(in_flight)
+    if errors:
+        api.delete_many(ids)
+        raise errors[0]
+    return ids
+
+
+def load_via_mongo(posts, uri, database, batch_size=500, concurrency=4):
+    """insert_many straight into the posts collection; returns the number inserted"""
+    try:
+        from pymongo import MongoClient
+    except ImportError:
+        raise RuntimeError("Loading into MongoDB needs pymongo: pip install pymongo")
+
+    collection = MongoClient(uri)[database][MONGO_COLLECTION]
+    now = datetime.datetime.utcnow()
+
+    def _batches():
+        batch = []
+        for post in posts:
+            batch.append({**post, "likeCount": 0, "createdAt": now})
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _insert(batch):
+        return len(collection.insert_many(batch, ordered=False).inserted_ids)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return sum(executor.map(_insert, _batches()))
+
+
+def delete_via_mongo(uri, database, tag):
+    """Remove every post carrying a tag; returns the number deleted"""
+    from pymongo import MongoClient
+
+    return MongoClient(uri)[database][MONGO_COLLECTION].delete_many({"tags": tag}).deleted_count
@@ -0,0 +1,85 @@
+"""
+Batched DOM snapshots.
+
+Collects visibility, bounding box, text and key attributes for every
+element matched by a list of selectors in a single execute_script call,
+instead of an is_displayed()/size/text round trip per element. Tests then
+filter the returned snapshots locally.
+"""
+
+from collections import namedtuple
+
+from utils.locators import QUERY_JS, Locator, normalize_candidate, to_payload
+
+DEFAULT_ATTRIBUTES = ("id", "class", "name", "role", "type", "href", "aria-label", "data-testid")
+
+ElementSnapshot = namedtuple(
+    "ElementSnapshot",
+    ["element", "selector", "tag", "visible", "enabled", "x", "y", "width", "height", "text", "attributes"],
+)
+
+SNAPSHOT_JS = QUERY_JS + """
+const [candidates, options, root] = arguments;
+const scope = root || document;
+
+const seen = new Set();
+const rows = [];
+candidates.forEach(([kind, selector], index) => {
+    let nodes;
+    try {
+        nodes = query(scope, kind, selector);
+    } catch (e) {
+        return;  // invalid selector (e.g. jQuery-only :contains) - skip it
+    }
+    for (const el of nodes) {
+        if (el.nodeType !== 1 || (options.dedupe && seen.has(el))) continue;
+        seen.add(el);
+        const rect = el.getBoundingClientRect();
+        const attributes = {};
+        for (const name of options.attributes) {
+            const value = el.getAttribute(name);
+            if (value !== null) attributes[name] = value;
+        }
+        rows.push([
+            options.elements ? el : null,
+            index,
+            el.tagName.toLowerCase(),
+            isVisible(el),
+            isEnabled(el),
+            rect.left, rect.top, rect.width, rect.height,
+            (el.innerText || el.textContent || '').trim().slice(0, options.maxText),
+            attributes,
+        ]);
+    }
+});
+return rows;
+"""
+
+
+def snapshot(driver, candidates, attributes=DEFAULT_ATTRIBUTES, max_text=200,
+             elements=False, dedupe=True, root=None):
+    """
+    Snapshot every element matched by any candidate selector, in document
+    order per selector. An element matched by several selectors is reported
+    once (under the first) unless dedupe=False. Pass elements=True to also
+    get WebElement references for the elements the test wants to act on.
+    """
+    if isinstance(candidates, Locator):
+        normalized, payload = candidates.candidates, candidates.payload
+    else:
+        normalized = [normalize_candidate(c) for c in candidates]
+        payload = to_payload(normalized)
+    options = {"attributes": list(attributes), "maxText": max_text, "elements": elements, "dedupe": dedupe}
+    rows = driver.execute_script(SNAPSHOT_JS, payload, options, root) or []
+    return [
+        ElementSnapshot(row[0], normalized[row[1]][1], *row[2:])
+        for row in rows
+    ]
+
+
+def displayed(snapshots, enabled=False, min_text=0):
+    """Snapshots of elements that are shown with a non-zero size"""
+    return [
+        s for s in snapshots
+        if s.visible and s.width > 0 and (s.enabled or not enabled) and len(s.text) >= min_text
+    ]
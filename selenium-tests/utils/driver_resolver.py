@@ -0,0 +1,123 @@
+"""
+Offline chromedriver resolution.
+
+Finds a chromedriver matching the installed Chrome major version without
+touching the network on warm runs: an explicit CHROMEDRIVER_PATH pin wins,
+then a local cache keyed by Chrome major version, then a matching system
+chromedriver. Only a cold cache falls back to webdriver-manager.
+
+Run `python -m utils.driver_resolver` (e.g. at Docker build time) to
+pre-populate the cache.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from collections import namedtuple
+
+from utils.shared_files import locked, write_json_atomic
+
+DEFAULT_CACHE_PATH = os.path.expanduser("~/.cache/mern-selenium/chromedriver.json")
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+Resolution = namedtuple("Resolution", ["path", "source", "chrome_major", "seconds"])
+
+_lock = threading.Lock()
+_resolved = None
+
+
+def _major_version(command):
+    """Run `<binary> --version` and return the major version number"""
+    try:
+        output = subprocess.run(
+            [command, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+)\.\d+", output)
+    return match.group(1) if match else None
+
+
+def chrome_major_version():
+    """Major version of the locally installed Chrome, or None"""
+    candidates = [os.getenv("CHROME_BINARY")] + CHROME_BINARIES
+    for binary in filter(None, candidates):
+        path = shutil.which(binary) or (binary if os.path.exists(binary) else None)
+        if path:
+            major = _major_version(path)
+            if major:
+                return major
+    return None
+
+
+def _cache_path():
+    return os.getenv("DRIVER_CACHE", DEFAULT_CACHE_PATH)
+
+
+def _read_cache():
+    try:
+        with open(_cache_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(major, path):
+    # xdist workers resolve at the same time; a torn file would send the next run to the network
+    with locked(_cache_path()):
+        cache = _read_cache()
+        cache[major] = path
+        write_json_atomic(_cache_path(), cache, indent=2)
+
+
+def _resolve():
+    pinned = os.getenv("CHROMEDRIVER_PATH")
+    if pinned:
+        return pinned, "pinned", None
+
+    major = chrome_major_version()
+    cached = _read_cache().get(major) if major else None
+    if cached and os.path.exists(cached):
+        return cached, "cache", major
+
+    system = shutil.which("chromedriver")
+    if system and major and _major_version(system) == major:
+        _write_cache(major, system)
+        return system, "system", major
+
+    # Cold cache: the only path that needs network access
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        path = ChromeDriverManager().install()
+        if major:
+            _write_cache(major, path)
+        return path, "webdriver-manager", major
+    except Exception as e:
+        print(f"⚠️  webdriver-manager failed: {e}")
+
+    # Let Selenium Manager / PATH lookup have a go
+    return system, "selenium-default", major
+
+
+def resolve_chromedriver():
+    """Return a Resolution for the chromedriver binary (memoized per process)"""
+    global _resolved
+    with _lock:
+        if _resolved is None:
+            start = time.perf_counter()
+            path, source, major = _resolve()
+            _resolved = Resolution(path, source, major, time.perf_counter() - start)
+            print(
+                f"🔧 chromedriver resolved via {source} in {_resolved.seconds * 1000:.0f} ms "
+                f"(Chrome {major or 'unknown'}): {path or 'default lookup'}"
+            )
+        return _resolved
+
+
+if __name__ == "__main__":
+    resolve_chromedriver()
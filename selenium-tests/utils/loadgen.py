@@ -0,0 +1,318 @@
+"""
+Open-loop HTTP load generator for the /posts API (server/controllers/posts.js).
+
+Issues a weighted mix of getPosts/createPost/updatePost/likePost/deletePost
+requests at a fixed arrival rate over a pooled keep-alive connector and
+records a latency histogram, errors and throughput per endpoint.
+
+Latency is measured from each request's scheduled start, not from when it
+was actually sent, so a stalled server shows up in the percentiles instead
+of silently lowering the offered load.
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter
+
+try:
+    import aiohttp
+except ImportError:  # Only needed by the load tool, not by the Selenium suite
+    aiohttp = None
+
+from utils.datagen import generate_post
+
+OPERATIONS = ("get", "create", "update", "like", "delete")
+DEFAULT_MIX = {"get": 70, "create": 10, "update": 5, "like": 10, "delete": 5}
+
+
+def parse_mix(spec):
+    """'get:70,like:30' -> {'get': 70.0, 'like': 30.0}"""
+    mix = {}
+    for part in spec.split(","):
+        name, weight = part.split(":")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}' (expected one of {', '.join(OPERATIONS)})")
+        mix[name] = float(weight)
+    return mix
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (~1% resolution, constant memory)"""
+
+    GROWTH = 1.01
+
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        ms = max(seconds * 1000, 0.001)
+        self.buckets[int(math.log(ms * 1000) / math.log(self.GROWTH))] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def _bucket_ms(self, index):
+        return self.GROWTH ** (index + 1) / 1000
+
+    def percentile(self, p):
+        if not self.count:
+            return None
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._bucket_ms(index), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 2) if self.count else None,
+            "p50_ms": _round(self.percentile(50)),
+            "p95_ms": _round(self.percentile(95)),
+            "p99_ms": _round(self.percentile(99)),
+            "max_ms": round(self.max, 2),
+            # Upper bucket bound (ms) -> count, for plotting
+            "histogram": {f"{self._bucket_ms(i):.3f}": n for i, n in sorted(self.buckets.items())},
+        }
+
+
+def _round(value):
+    return round(value, 2) if value is not None else None
+
+
+async def request_json(session, url, method, path="", payload=None):
+    """One /posts call; HTTP errors raise ClientResponseError with the start of the body"""
+    async with session.request(method, f"{url}{path}", json=payload) as response:
+        body = await response.read()
+        if response.status >= 400:
+            raise aiohttp.ClientResponseError(
+                response.request_info, response.history,
+                status=response.status, message=body[:200].decode("utf-8", "replace")
+            )
+        return json.loads(body) if body else None
+
+
+class EndpointStats:
+    """Latency and error counts for one operation"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = Counter()
+
+    def summary(self):
+        report = self.latency.summary()
+        requests = report["count"]
+        report["errors"] = sum(self.errors.values())
+        report["error_rate"] = round(report["errors"] / requests, 4) if requests else 0.0
+        report["error_breakdown"] = dict(self.errors)
+        return report
+
+
+class LoadGenerator:
+    """Drive a weighted operation mix against /posts at a target request rate"""
+
+    def __init__(self, base_url, rps=50, duration=30, mix=None, connections=50,
+                 max_in_flight=500, seed_posts=20, tag="load", image_mix=None, seed=0):
+        if aiohttp is None:
+            raise RuntimeError("The load generator needs aiohttp: pip install aiohttp")
+        self.url = f"{base_url.rstrip('/')}/posts"
+        self.rps = rps
+        self.duration = duration
+        self.mix = mix or DEFAULT_MIX
+        self.connections = connections
+        self.max_in_flight = max_in_flight
+        self.seed_posts = seed_posts
+        self.tag = tag
+        self.image_mix = image_mix or {0: 1.0}
+        self.rng = random.Random(seed)
+        self.stats = {name: EndpointStats() for name in self.mix}
+        self.ids = []
+        self.dropped = 0
+        self.session = None
+
+    def _new_post(self):
+        return generate_post(self.rng, tags=[self.tag], image_mix=self.image_mix)
+
+    async def _call(self, method, path="", payload=None):
+        return await request_json(self.session, self.url, method, path, payload)
+
+    def _resolve(self, name):
+        """The operation that will actually run: create when there is no post to act on"""
+        if name not in ("get", "create") and not self.ids:
+            return "create"
+        return name
+
+    async def _operation(self, name):
+        """Run one resolved operation"""
+        if name == "get":
+            await self._call("GET")
+        elif name == "create":
+            created = await self._call("POST", payload=self._new_post())
+            self.ids.append(created["_id"])
+        elif name == "update":
+            post_id = self.rng.choice(self.ids)
+            await self._call("PATCH", f"/{post_id}", payload={**self._new_post(), "_id": post_id})
+        elif name == "like":
+            await self._call("PATCH", f"/{self.rng.choice(self.ids)}/likePost")
+        elif name == "delete":
+            post_id = self.ids.pop(self.rng.randrange(len(self.ids)))
+            await self._call("DELETE", f"/{post_id}")
+
+    async def _timed(self, name, scheduled, in_flight):
+        # Resolved before the call, so a fallback create's latency and errors both count as create
+        name = self._resolve(name)
+        stats = self.stats.setdefault(name, EndpointStats())
+        try:
+            await self._operation(name)
+            stats.latency.record(time.perf_counter() - scheduled)
+        except aiohttp.ClientResponseError as e:
+            stats.errors[f"HTTP {e.status}"] += 1
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError) as e:
+            stats.errors[type(e).__name__] += 1
+        finally:
+            in_flight.release()
+
+    async def _prefill(self):
+        await asyncio.gather(*(self._operation("create") for _ in range(self.seed_posts)))
+
+    async def _cleanup(self):
+        ids, self.ids = self.ids, []
+        await asyncio.gather(
+            *(self._call("DELETE", f"/{post_id}") for post_id in ids), return_exceptions=True
+        )
+
+    async def run(self):
+        """Generate load for `duration` seconds and return the report dict"""
+        connector = aiohttp.TCPConnector(limit=self.connections, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as self.session:
+            await self._prefill()
+
+            names = list(self.mix)
+            weights = list(self.mix.values())
+            in_flight = asyncio.Semaphore(self.max_in_flight)
+            tasks = set()
+            interval = 1 / self.rps
+            start = time.perf_counter()
+            total = int(self.rps * self.duration)
+
+            for i in range(total):
+                scheduled = start + i * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # Open loop: shed (and count) requests rather than slow the arrival rate
+                if in_flight.locked():
+                    self.dropped += 1
+                    continue
+                await in_flight.acquire()
+                name = self.rng.choices(names, weights=weights)[0]
+                task = asyncio.ensure_future(self._timed(name, scheduled, in_flight))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - start
+            await self._cleanup()
+
+        return self.report(elapsed)
+
+    def report(self, elapsed):
+        endpoints = {name: stats.summary() for name, stats in self.stats.items()}
+        completed = sum(e["count"] for e in endpoints.values())
+        errors = sum(e["errors"] for e in endpoints.values())
+        return {
+            "url": self.url,
+            "target_rps": self.rps,
+            "duration_s": round(elapsed, 2),
+            "mix": self.mix,
+            "connections": self.connections,
+            "requests": completed + errors,
+            "completed": completed,
+            "errors": errors,
+            "dropped": self.dropped,
+            "throughput_rps": round(completed / elapsed, 2) if elapsed else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+async def like_race(base_url, posts=5, likes_per_post=50, connections=50, tag="load"):
+    """
+    Fire likes_per_post concurrent likePost requests at each of `posts` fresh
+    posts, then compare each final likeCount with the likes that succeeded.
+    Every missing increment is a lost update.
+    """
+    if aiohttp is None:
+        raise RuntimeError("The load generator needs aiohttp: pip install aiohttp")
+    url = f"{base_url.rstrip('/')}/posts"
+    stats = EndpointStats()
+    rng = random.Random(0)
+
+    async def like(session, post_id, start_line):
+        await start_line.wait()
+        started = time.perf_counter()
+        try:
+            await request_json(session, url, "PATCH", f"/{post_id}/likePost")
+            stats.latency.record(time.perf_counter() - started)
+            return True
+        except aiohttp.ClientResponseError as e:
+            stats.errors[f"HTTP {e.status}"] += 1
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            stats.errors[type(e).__name__] += 1
+        return False
+
+    connector = aiohttp.TCPConnector(limit=connections)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30)) as session:
+        created = await asyncio.gather(*(
+            request_json(session, url, "POST", payload=generate_post(rng, tags=[tag], image_mix={0: 1.0}))
+            for _ in range(posts)
+        ))
+        ids = [post["_id"] for post in created]
+        try:
+            # Release every like at once for maximum contention
+            start_line = asyncio.Event()
+            likes = {
+                post_id: [asyncio.ensure_future(like(session, post_id, start_line)) for _ in range(likes_per_post)]
+                for post_id in ids
+            }
+            start = time.perf_counter()
+            start_line.set()
+            await asyncio.gather(*(task for tasks in likes.values() for task in tasks))
+            elapsed = time.perf_counter() - start
+
+            per_post = []
+            for post_id, tasks in likes.items():
+                succeeded = sum(task.result() for task in tasks)
+                final = (await request_json(session, url, "GET", f"/{post_id}"))["likeCount"]
+                per_post.append({
+                    "id": post_id,
+                    "successful_likes": succeeded,
+                    "like_count": final,
+                    "lost_updates": succeeded - final,
+                })
+        finally:
+            await asyncio.gather(*(request_json(session, url, "DELETE", f"/{post_id}") for post_id in ids),
+                                 return_exceptions=True)
+
+    successful = sum(p["successful_likes"] for p in per_post)
+    lost = sum(p["lost_updates"] for p in per_post)
+    return {
+        "url": url,
+        "posts": posts,
+        "likes_per_post": likes_per_post,
+        "duration_s": round(elapsed, 2),
+        "successful_likes": successful,
+        "lost_updates": lost,
+        "lost_update_rate": round(lost / successful, 4) if successful else 0.0,
+        "latency": stats.summary(),
+        "per_post": per_post,
+    }
@@ -0,0 +1,107 @@
+"""
+On-disk cache of learned locators.
+
+Remembers which candidate selector won for each logical element on each
+page, so the next run tries it first. Entries are tied to a fingerprint of
+the frontend bundle and are evicted as soon as the bundle changes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from utils.shared_files import locked, write_json_atomic
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ".locator_cache.json",
+)
+
+# Fingerprints every script bundle the page loaded (cheap djb2 over the text)
+BUNDLE_FINGERPRINT_JS = """
+const done = arguments[arguments.length - 1];
+const sources = Array.from(document.scripts).map((s) => s.src).filter(Boolean);
+
+function djb2(text) {
+    let hash = 5381;
+    for (let i = 0; i < text.length; i++) hash = ((hash << 5) + hash + text.charCodeAt(i)) | 0;
+    return hash;
+}
+
+Promise.all(sources.map((src) => fetch(src)
+    .then((response) => response.text())
+    .then((text) => `${src}:${text.length}:${djb2(text)}`)
+    .catch(() => src)))
+    .then((parts) => done(parts.join('|')));
+"""
+
+
+def build_hash_from_page(driver):
+    """Fingerprint the frontend bundle currently loaded in the browser"""
+    env_hash = os.getenv("APP_BUILD_HASH")
+    if env_hash:
+        return env_hash
+    fingerprint = driver.execute_async_script(BUNDLE_FINGERPRINT_JS)
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+class LocatorCache:
+    """Learned selector per (page, logical element) for one app build"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.build_hash = None
+        self.entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def bind(self, build_hash):
+        """Load entries for this build, evicting everything recorded for another one"""
+        self.build_hash = build_hash
+        data = self._read()
+        if data.get("build") == build_hash:
+            self.entries = data.get("entries", {})
+            print(f"🗂️  Locator cache: {len(self.entries)} learned element(s) for build {build_hash}")
+        else:
+            self.entries = {}
+            self._dirty = bool(data)
+            if data:
+                print(f"🗂️  Locator cache: frontend build changed, evicted entries for {data.get('build')}")
+
+    @property
+    def bound(self):
+        return self.build_hash is not None
+
+    def lookup(self, name):
+        """Return {page: selector} of learned winners for a logical element"""
+        return dict(self.entries.get(name, {}))
+
+    def record(self, page, name, selector):
+        """Remember the selector that matched a logical element on a page"""
+        with self._lock:
+            pages = self.entries.setdefault(name, {})
+            if pages.get(page) != selector:
+                pages[page] = selector
+                self._dirty = True
+
+    def save(self):
+        """Merge with the file on disk and write it atomically (other xdist workers save too)"""
+        if not self._dirty or not self.bound:
+            return
+        with self._lock, locked(self.path):
+            data = self._read()
+            entries = data.get("entries", {}) if data.get("build") == self.build_hash else {}
+            for name, pages in self.entries.items():
+                entries.setdefault(name, {}).update(pages)
+            write_json_atomic(
+                self.path, {"build": self.build_hash, "entries": entries}, indent=2, sort_keys=True
+            )
+            self._dirty = False
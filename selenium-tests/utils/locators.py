@@ -0,0 +1,205 @@
+"""
+Locator engine for the Selenium suite.
+
+Resolves an ordered list of fallback selectors inside the browser with a
+single execute_script call instead of one find_element round trip (and one
+implicit wait) per candidate. Locator holds such a list normalized and
+compiled once, for the page objects in pages/.
+"""
+
+from collections import namedtuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+LocatorMatch = namedtuple("LocatorMatch", ["element", "selector", "by", "index", "page"])
+
+# Helpers shared by every in-page locator script (here and in utils.dom_snapshot)
+QUERY_JS = """
+function isVisible(el) {
+    if (!el.getClientRects().length) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+
+function isEnabled(el) {
+    return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+
+// Matches of one [kind, selector] payload entry below scope; throws on an invalid selector
+function query(scope, kind, selector) {
+    if (kind === 'xpath') {
+        const snapshot = document.evaluate(
+            selector, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        return nodes;
+    }
+    return Array.from(scope.querySelectorAll(selector));
+}
+"""
+
+# Runs entirely in the page: first candidate with a matching element wins
+RESOLVE_JS = QUERY_JS + """
+const [candidates, options, root] = arguments;
+const scope = root || document;
+const page = window.location.pathname;
+
+// A previously learned winner for this page is tried before the rest
+const order = candidates.map((c, i) => i);
+const preferred = (options.prefer || {})[page];
+if (preferred !== undefined) {
+    order.splice(order.indexOf(preferred), 1);
+    order.unshift(preferred);
+}
+
+for (const i of order) {
+    const [kind, selector] = candidates[i];
+    let nodes;
+    try {
+        nodes = query(scope, kind, selector);
+    } catch (e) {
+        continue;  // invalid selector (e.g. jQuery-only :contains) - skip it
+    }
+    for (const el of nodes) {
+        if (el.nodeType !== 1) continue;
+        if (options.visible && !isVisible(el)) continue;
+        if (options.enabled && !isEnabled(el)) continue;
+        if ((el.innerText || el.textContent || '').trim().length < options.minText) continue;
+        return [el, i, page];
+    }
+}
+return null;
+"""
+
+
+def normalize_candidate(candidate):
+    """Turn a selector spec into a (by, selector) pair"""
+    if isinstance(candidate, (tuple, list)):
+        selector, by = candidate
+    elif candidate.startswith(("/", "(", "./")):
+        selector, by = candidate, By.XPATH
+    else:
+        selector, by = candidate, By.CSS_SELECTOR
+
+    if by == By.ID:
+        return By.CSS_SELECTOR, f"#{selector}"
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f"[name='{selector}']"
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{selector}"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, selector
+    return by, selector
+
+
+def to_payload(candidates):
+    """(by, selector) pairs -> [kind, selector] pairs for the in-page resolver"""
+    return [["xpath" if by == By.XPATH else "css", selector] for by, selector in candidates]
+
+
+def _resolve(driver, candidates, options, root, payload=None):
+    """Evaluate all candidates in one browser round trip"""
+    payload = payload or to_payload(candidates)
+    result = driver.execute_script(RESOLVE_JS, payload, options, root)
+    if not result:
+        return None
+    element, index, page = result
+    by, selector = candidates[index]
+    return LocatorMatch(element, selector, by, index, page)
+
+
+def find_first(driver, candidates, visible=True, enabled=True, min_text=0,
+               root=None, timeout=0, poll_frequency=0.1, prefer=None):
+    """
+    Return a LocatorMatch for the first candidate that matches, or None.
+
+    Candidates are tried in order; a candidate only wins if one of its
+    elements is displayed (and enabled, when requested). execute_script is
+    not subject to the implicit wait, so a full miss costs one round trip.
+    With a timeout the whole list is re-evaluated until something matches.
+
+    prefer maps a page path to the selector that should be tried first on
+    that page (see utils.locator_cache). candidates may be a Locator, whose
+    compiled payload is reused as is.
+    """
+    if isinstance(candidates, Locator):
+        normalized, payload = candidates.candidates, candidates.payload
+    else:
+        normalized = [normalize_candidate(c) for c in candidates]
+        payload = to_payload(normalized)
+    selectors = [selector for _, selector in normalized]
+    options = {
+        "visible": visible,
+        "enabled": enabled,
+        "minText": min_text,
+        "prefer": {
+            page: selectors.index(selector)
+            for page, selector in (prefer or {}).items()
+            if selector in selectors
+        },
+    }
+
+    if timeout <= 0:
+        return _resolve(driver, normalized, options, root, payload)
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(
+            lambda d: _resolve(d, normalized, options, root, payload)
+        )
+    except TimeoutException:
+        return None
+
+
+
+# Every element of the first candidate that matches anything, in document order
+FIND_ALL_JS = QUERY_JS + """
+const [candidates, options, root] = arguments;
+const scope = root || document;
+
+for (const [kind, selector] of candidates) {
+    let nodes;
+    try {
+        nodes = query(scope, kind, selector);
+    } catch (e) {
+        continue;  // invalid selector (e.g. jQuery-only :contains) - skip it
+    }
+    // Fallbacks are alternatives, not a union: broad ones like [class*='card'] also match children
+    nodes = nodes.filter((el) => el.nodeType === 1 && (!options.visible || isVisible(el)));
+    if (nodes.length) return nodes;
+}
+return [];
+"""
+
+
+class Locator:
+    """
+    A logical element: an ordered list of fallback selectors, normalized
+    and compiled once when the page object class is defined.
+
+    find() returns the first element of the first candidate (in priority
+    order) that matches; find_all() returns every element of that candidate.
+    Both cost a single execute_script call.
+    """
+
+    def __init__(self, name, *candidates):
+        self.name = name
+        self.candidates = tuple(normalize_candidate(c) for c in candidates)
+        self.payload = to_payload(self.candidates)
+        self.selectors = [selector for _, selector in self.candidates]
+
+    def __repr__(self):
+        return f"Locator({self.name!r}, {len(self.candidates)} candidates)"
+
+    def __iter__(self):
+        # (selector, by) pairs, so a Locator works wherever a candidate list does
+        return ((selector, by) for by, selector in self.candidates)
+
+    def find(self, driver, **kwargs):
+        """LocatorMatch for the first matching candidate, or None (see find_first)"""
+        return find_first(driver, self, **kwargs)
+
+    def find_all(self, driver, visible=True, root=None):
+        """Every element matched by the first matching candidate, in document order"""
+        return driver.execute_script(FIND_ALL_JS, self.payload, {"visible": visible}, root) or []
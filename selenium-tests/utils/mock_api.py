@@ -0,0 +1,305 @@
+"""
+In-process stand-in for the posts API.
+
+Implements the six routes of server/routes/posts.js on a ThreadingHTTPServer
+with the posts held in memory, answering with the same bodies and status
+codes as server/controllers/posts.js (including its plain-text 404s for
+malformed ids, `null` for missing posts and cors()'s headers and preflight).
+MOCK_API=true makes conftest start it on a free port (or MOCK_API_PORT)
+instead of Express + MongoDB, and points API_URL and the frontend's
+REACT_APP_API_URL at it.
+Run: python -m utils.mock_api --port 5000
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+MOCK_API = os.getenv("MOCK_API", "false").lower() == "true"
+MOCK_API_PORT = int(os.getenv("MOCK_API_PORT", "0"))
+MAX_BODY = 30 * 1024 * 1024  # bodyParser limit: '30mb'
+
+STRING_FIELDS = ("title", "message", "creator", "selectedFile")
+# Field order of a PostMessage document as mongoose serializes it
+FIELD_ORDER = ("title", "message", "creator", "tags", "selectedFile", "likeCount", "createdAt", "_id", "__v")
+ROUTE = re.compile(r"^/posts(?:/(?P<id>[^/]+)(?P<like>/likePost)?)?/?$")
+HEX_ID = re.compile(r"^[0-9a-fA-F]{24}$")
+
+EXPRESS_404 = (
+    '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>Error</title>\n'
+    "</head>\n<body>\n<pre>Cannot {method} {path}</pre>\n</body>\n</html>\n"
+)
+
+
+def cors_headers(request_headers=None):
+    """What cors() on the Express server answers with"""
+    requested = {k.lower(): v for k, v in (request_headers or {}).items()}
+    return [
+        ("Access-Control-Allow-Origin", "*"),
+        ("Access-Control-Allow-Methods", "GET,HEAD,PUT,PATCH,POST,DELETE"),
+        ("Access-Control-Allow-Headers", requested.get("access-control-request-headers", "Content-Type")),
+    ]
+
+
+def is_valid_id(value):
+    """mongoose.Types.ObjectId.isValid: 24 hex characters or any 12-character string"""
+    return bool(HEX_ID.match(value)) or len(value) == 12
+
+
+def iso_now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class PostStore:
+    """The PostMessage collection, in memory and in insertion order"""
+
+    def __init__(self):
+        self.posts = {}
+        self._lock = threading.Lock()
+        self._process = os.urandom(5).hex()
+        self._counter = itertools.count(int.from_bytes(os.urandom(3), "big"))
+        # The schema's `default: new Date()` is evaluated once, when the model loads
+        self.created_at = iso_now()
+
+    def object_id(self):
+        """Timestamp, per-process random value and counter, like a BSON ObjectId"""
+        return f"{int(time.time()):08x}{self._process}{next(self._counter) % 0xFFFFFF:06x}"
+
+    @staticmethod
+    def cast(fields):
+        """Mongoose casting for the schema's String and [String] paths; unknown keys are dropped"""
+        cast = {}
+        for name in STRING_FIELDS:
+            if name in fields:
+                value = fields[name]
+                cast[name] = value if value is None or isinstance(value, str) else json.dumps(value)
+        if "tags" in fields:
+            tags = fields["tags"]
+            if tags is None:
+                cast["tags"] = None
+            else:
+                tags = tags if isinstance(tags, list) else [tags]
+                cast["tags"] = [tag if tag is None or isinstance(tag, str) else json.dumps(tag) for tag in tags]
+        return cast
+
+    @staticmethod
+    def document(post):
+        return {name: post[name] for name in FIELD_ORDER if name in post}
+
+    def list(self):
+        with self._lock:
+            return [self.document(post) for post in self.posts.values()]
+
+    def get(self, post_id):
+        with self._lock:
+            post = self.posts.get(post_id)
+            return self.document(post) if post else None
+
+    def create(self, fields):
+        post = {"tags": [], **self.cast(fields), "likeCount": 0, "createdAt": self.created_at,
+                "_id": self.object_id(), "__v": 0}
+        with self._lock:
+            self.posts[post["_id"]] = post
+        return self.document(post)
+
+    def update(self, post_id, fields):
+        """findByIdAndUpdate(id, {creator, title, message, tags, selectedFile}, {new: true})"""
+        changes = self.cast({k: v for k, v in fields.items() if k in STRING_FIELDS or k == "tags"})
+        with self._lock:
+            post = self.posts.get(post_id)
+            if not post:
+                return None
+            post.update(changes)
+            return self.document(post)
+
+    def delete(self, post_id):
+        with self._lock:
+            return self.posts.pop(post_id, None)
+
+    def like(self, post_id):
+        with self._lock:
+            post = self.posts.get(post_id)
+            if not post:
+                return None
+            post["likeCount"] += 1
+            return self.document(post)
+
+    def clear(self):
+        with self._lock:
+            self.posts.clear()
+
+
+class PostsRequestHandler(BaseHTTPRequestHandler):
+    """Routing of server/routes/posts.js, responses of server/controllers/posts.js"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, as Express does
+    store = None
+
+    def _send(self, status, body=b"", content_type=None, headers=(), cors=True):
+        self.send_response(status)
+        self.send_header("X-Powered-By", "Express")
+        if cors:
+            for name, value in headers or cors_headers()[:1]:
+                self.send_header(name, value)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def send_json(self, status, value):
+        self._send(status, json.dumps(value, separators=(",", ":")).encode("utf-8"),
+                   "application/json; charset=utf-8")
+
+    def send_text(self, status, text):
+        """res.send(string)"""
+        self._send(status, text.encode("utf-8"), "text/html; charset=utf-8")
+
+    def read_body(self):
+        """bodyParser.json / urlencoded; returns None after answering a 4xx itself"""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self.rfile.read(length)
+            self._send(413, b"request entity too large", "text/html; charset=utf-8", cors=False)
+            return None
+        raw = self.rfile.read(length) if length else b""
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        if not raw:
+            return {}
+        if content_type == "application/json":
+            text = raw.decode("utf-8", "replace")
+            try:
+                # strict mode only accepts objects and arrays
+                if text.lstrip()[:1] not in ("{", "["):
+                    raise ValueError(text[:20])
+                body = json.loads(text)
+            except ValueError as e:
+                self._send(400, f"SyntaxError: {e}".encode("utf-8"), "text/html; charset=utf-8", cors=False)
+                return None
+            return body if isinstance(body, dict) else {}
+        if content_type == "application/x-www-form-urlencoded":
+            return dict(parse_qsl(raw.decode("utf-8", "replace")))
+        return {}
+
+    def dispatch(self):
+        path = urlparse(self.path).path
+        route = ROUTE.match(path)
+        method = "GET" if self.command == "HEAD" else self.command
+        body = {}
+        if method in ("POST", "PATCH", "PUT"):
+            body = self.read_body()
+            if body is None:
+                return
+        if not route:
+            return self.not_found(path)
+        post_id, like = route.group("id"), route.group("like")
+
+        if not post_id:
+            if method == "GET":
+                return self.send_json(200, self.store.list())
+            if method == "POST":
+                return self.send_json(201, self.store.create(body))
+            return self.not_found(path)
+
+        if like:
+            if method != "PATCH":
+                return self.not_found(path)
+            if not is_valid_id(post_id):
+                return self.send_text(404, f"No post with id: {post_id}")
+            post = self.store.like(post_id)
+            if post is None:
+                # The controller dereferences the missing post and the request fails
+                return self.send_json(500, {"message": "Cannot read properties of null (reading 'likeCount')"})
+            return self.send_json(200, post)
+
+        if method == "GET":
+            if not is_valid_id(post_id):
+                return self.send_json(404, {"message": (
+                    f'Cast to ObjectId failed for value "{post_id}" (type string) '
+                    f'at path "_id" for model "PostMessage"'
+                )})
+            return self.send_json(200, self.store.get(post_id))
+        if method == "PATCH":
+            if not is_valid_id(post_id):
+                return self.send_text(404, f"No post with id: {post_id}")
+            return self.send_json(200, self.store.update(post_id, body))
+        if method == "DELETE":
+            if not is_valid_id(post_id):
+                return self.send_text(404, f"No post with id: {post_id}")
+            if self.store.delete(post_id) is None:
+                return self.send_json(404, {"message": "Post not found"})
+            return self.send_json(200, {"message": "Post deleted successfully"})
+        return self.not_found(path)
+
+    def not_found(self, path):
+        """Express's default 404 for unrouted requests"""
+        self.send_text(404, EXPRESS_404.format(method=self.command, path=path))
+
+    def do_OPTIONS(self):
+        # cors() ends every preflight with 204
+        headers = cors_headers(self.headers) + [("Vary", "Access-Control-Request-Headers")]
+        self._send(204, headers=headers)
+
+    do_GET = do_HEAD = do_POST = do_PATCH = do_PUT = do_DELETE = dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PostsHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 makes bursts of connections (load tests, like races) wait for SYN retries
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class MockPostsServer:
+    """The posts API on a background thread; start() returns once it is listening"""
+
+    def __init__(self, host="127.0.0.1", port=MOCK_API_PORT, store=None):
+        self.store = store or PostStore()
+        handler = type("Handler", (PostsRequestHandler,), {"store": self.store})
+        self.server = PostsHTTPServer((host, port), handler)
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="mock-api", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread:
+            self.thread.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory stand-in for the Memories posts API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    args = parser.parse_args()
+    server = MockPostsServer(args.host, args.port)
+    print(f"Mock posts API on {server.url}/posts", flush=True)
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+In-page network tracker.
+
+Injects a small fetch/XHR counter into every document through CDP so the
+harness can synchronize on the real /posts round trips made by axios
+instead of guessing with sleeps.
+"""
+
+from utils.readiness import wait_for_network_idle, wait_until
+
+# Registered with Page.addScriptToEvaluateOnNewDocument, runs before the app
+TRACKER_JS = """
+(function () {
+    if (window.__netTracker) return;
+    const tracker = window.__netTracker = {pending: 0, started: 0, lastActivity: Date.now(), log: []};
+
+    function begin() {
+        tracker.pending++;
+        tracker.started++;
+        tracker.lastActivity = Date.now();
+    }
+
+    function finish(method, url, status) {
+        tracker.pending = Math.max(0, tracker.pending - 1);
+        tracker.lastActivity = Date.now();
+        tracker.log.push({method: method, url: String(url), status: status, at: tracker.lastActivity});
+        if (tracker.log.length > 100) tracker.log.shift();
+    }
+
+    const open = XMLHttpRequest.prototype.open;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__netInfo = {method: String(method).toUpperCase(), url: url};
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        const info = this.__netInfo || {method: 'GET', url: ''};
+        begin();
+        this.addEventListener('loadend', () => finish(info.method, info.url, this.status), {once: true});
+        try {
+            return send.apply(this, arguments);
+        } catch (e) {
+            finish(info.method, info.url, 0);
+            throw e;
+        }
+    };
+
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function (input, init) {
+            const method = ((init && init.method) || (input && input.method) || 'GET').toUpperCase();
+            const url = (input && input.url) || input;
+            begin();
+            return originalFetch.apply(this, arguments).then(
+                (response) => { finish(method, url, response.status); return response; },
+                (error) => { finish(method, url, 0); throw error; });
+        };
+    }
+})();
+"""
+
+PENDING_JS = "return window.__netTracker ? window.__netTracker.pending : null;"
+
+COMPLETED_JS = """
+const tracker = window.__netTracker;
+if (!tracker) return [];
+const pattern = new RegExp(arguments[0]);
+return tracker.log.filter((entry) => pattern.test(entry.url)
+    && (!arguments[1] || entry.method === arguments[1]));
+"""
+
+
+def pending_requests(driver):
+    """Number of in-flight fetch/XHR requests, or None if the tracker is not loaded"""
+    return driver.execute_script(PENDING_JS)
+
+
+def completed_requests(driver, url_pattern=r"/posts", method=None):
+    """Completed requests whose URL matches a regex (newest last)"""
+    return driver.execute_script(COMPLETED_JS, url_pattern, method)
+
+
+def wait_for_request(driver, url_pattern=r"/posts", method=None, after=0, timeout=None):
+    """Wait until more than `after` matching requests have completed"""
+    def _done(d):
+        completed = completed_requests(d, url_pattern, method)
+        return completed if len(completed) > after else False
+
+    return wait_until(driver, _done, timeout, description=f"{method or 'any'} {url_pattern} request")
+
+
+def install_network_tracker(driver):
+    """Inject the tracker into every new document and expose helpers on the driver"""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_JS})
+    driver.pending_requests = lambda: pending_requests(driver)
+    driver.wait_for_network_idle = (
+        lambda quiet_ms=300, timeout=None: wait_for_network_idle(driver, quiet_ms, timeout)
+    )
+    return driver
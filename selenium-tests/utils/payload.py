@@ -0,0 +1,152 @@
+"""
+Payload-size profiling for GET /posts.
+
+getPosts returns every post, base64 selectedFile included, in one JSON
+array. These helpers measure what that costs as the post count and image
+size grow: response bytes, time to first byte (server time), transfer
+time, JSON parse time in Python and in the browser, and how long React
+takes to render the cards once the response has arrived.
+"""
+
+import json
+import statistics
+import time
+from collections import Counter
+
+from utils.datagen import generate_posts, load_via_api
+from utils.readiness import POST_CARD_SELECTOR
+
+# Fetch and parse /posts inside the page, timing each phase
+BROWSER_PARSE_JS = """
+const [url, done] = arguments;
+const start = performance.now();
+fetch(url).then(r => r.text()).then(text => {
+    const received = performance.now();
+    const posts = JSON.parse(text);
+    done({
+        fetch_ms: received - start,
+        parse_ms: performance.now() - received,
+        posts: posts.length,
+    });
+}).catch(e => done({error: String(e)}));
+"""
+
+# Registered with Page.addScriptToEvaluateOnNewDocument before the measured
+# navigation, so the moment the last card appears is seen however fast it is
+RENDER_OBSERVER_JS = """
+(function () {
+    const [selector, expected] = %s;
+    window.__cardsRendered = null;
+    const observer = new MutationObserver(() => {
+        if (document.querySelectorAll(selector).length < expected) return;
+        observer.disconnect();
+        // One more frame so layout/paint of the last card is included
+        requestAnimationFrame(() => { window.__cardsRendered = performance.now(); });
+    });
+    observer.observe(document, {childList: true, subtree: true});
+})();
+"""
+
+# Time from the /posts response finishing until the observer saw every card
+BROWSER_RENDER_JS = """
+const [selector, done] = arguments;
+const deadline = performance.now() + 60000;
+function check() {
+    const entry = performance.getEntriesByType('resource')
+        .filter(e => /\\/posts(\\?|$)/.test(e.name)).pop();
+    const rendered = window.__cardsRendered;
+    const cards = document.querySelectorAll(selector).length;
+    if (entry && typeof rendered === 'number') {
+        done({
+            render_ms: rendered - entry.responseEnd,
+            transfer_size: entry.transferSize,
+            cards: cards,
+        });
+    } else if (performance.now() > deadline) {
+        done({error: `timed out with ${cards} cards rendered`});
+    } else {
+        setTimeout(check, 50);
+    }
+}
+check();
+"""
+
+
+def bytes_by_field(posts):
+    """Serialized JSON bytes contributed by each post field"""
+    sizes = Counter()
+    for post in posts:
+        for field, value in post.items():
+            sizes[field] += len(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+    return dict(sizes.most_common())
+
+
+def measure_get(http, url, keep_body=False):
+    """One GET /posts: bytes, TTFB (server time), transfer and Python parse time"""
+    start = time.perf_counter()
+    response = http.request("GET", url, preload_content=False, retries=False)
+    first_byte = time.perf_counter()
+    body = response.read()
+    finished = time.perf_counter()
+    response.release_conn()
+    json.loads(body)
+    parsed = time.perf_counter()
+    sample = {
+        "bytes": len(body),
+        "server_ms": (first_byte - start) * 1000,
+        "transfer_ms": (finished - first_byte) * 1000,
+        "parse_ms": (parsed - finished) * 1000,
+    }
+    if keep_body:
+        sample["body"] = body
+    return sample
+
+
+def measure_browser(driver, app_url, api_url):
+    """Browser-side parse time for the raw response and render time for the real page"""
+    driver.set_script_timeout(90)
+    driver.get(app_url)
+    parse = driver.execute_async_script(BROWSER_PARSE_JS, f"{api_url.rstrip('/')}/posts")
+    if "error" in parse:
+        return parse
+    # Fresh navigation so the app's own fetch and render are what we time
+    observer = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": RENDER_OBSERVER_JS % json.dumps([POST_CARD_SELECTOR, parse["posts"]]),
+    })
+    try:
+        driver.get(app_url)
+        render = driver.execute_async_script(BROWSER_RENDER_JS, POST_CARD_SELECTOR)
+    finally:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", observer)
+    return {**parse, **render}
+
+
+def _median(samples, key):
+    return round(statistics.median(sample[key] for sample in samples), 2)
+
+
+def profile_point(api, count, image_bytes, tag, repeat=5, driver=None, app_url=None, seed=0):
+    """Load `count` posts with `image_bytes` images, measure GET /posts, then remove them"""
+    posts = generate_posts(count, seed=seed, tags=[tag], image_mix={image_bytes: 1.0})
+    ids = load_via_api(api, posts, concurrency=api.pool_size)
+    try:
+        # Samples hold timings only; the last body alone is kept and parsed once more for the breakdown
+        samples = [measure_get(api.http, api.url) for _ in range(repeat - 1)]
+        samples.append(measure_get(api.http, api.url, keep_body=True))
+        posts = json.loads(samples[-1].pop("body"))
+        result = {
+            "count": count,
+            "image_bytes": image_bytes,
+            "total_posts": len(posts),
+            "bytes": samples[-1]["bytes"],
+            "server_ms": _median(samples, "server_ms"),
+            "transfer_ms": _median(samples, "transfer_ms"),
+            "python_parse_ms": _median(samples, "parse_ms"),
+            "bytes_by_field": bytes_by_field(posts),
+        }
+        del posts
+        if driver is not None:
+            result["browser"] = measure_browser(driver, app_url, api.base_url)
+        return result
+    finally:
+        api.delete_many(ids)
@@ -0,0 +1,183 @@
+"""
+Browser performance metrics for every page visit.
+
+Pulls Navigation Timing, Paint Timing (FCP/LCP), long tasks and CDP
+Performance.getMetrics from the browser instead of timing driver.get with
+a stopwatch, and checks them against per-route budgets from
+perf_budgets.json.
+"""
+
+import json
+import os
+
+BUDGETS_PATH = os.getenv(
+    "PERF_BUDGETS", os.path.join(os.path.dirname(os.path.dirname(__file__)), "perf_budgets.json")
+)
+
+# Registered with Page.addScriptToEvaluateOnNewDocument: LCP and long tasks are
+# only observable from inside the page, so start listening before the app runs
+OBSERVER_JS = """
+(function () {
+    if (window.__perfMetrics || !window.PerformanceObserver) return;
+    const metrics = window.__perfMetrics = {lcp: null, longTasks: []};
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback))
+                .observe({type: type, buffered: true});
+        } catch (e) { /* entry type not supported */ }
+    };
+    observe('largest-contentful-paint', (entry) => { metrics.lcp = entry.startTime; });
+    observe('longtask', (entry) => {
+        metrics.longTasks.push({start: entry.startTime, duration: entry.duration});
+    });
+})();
+"""
+
+COLLECT_JS = """
+if (!location.protocol.startsWith('http')) return null;
+const nav = performance.getEntriesByType('navigation')[0];
+const paint = {};
+performance.getEntriesByType('paint').forEach((entry) => { paint[entry.name] = entry.startTime; });
+const observed = window.__perfMetrics || {lcp: null, longTasks: []};
+return {
+    url: location.href,
+    time_origin: performance.timeOrigin,
+    route: location.pathname,
+    ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+    dom_interactive_ms: nav ? nav.domInteractive : null,
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+    load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+    transfer_bytes: nav ? nav.transferSize : null,
+    fcp_ms: paint['first-contentful-paint'] || null,
+    lcp_ms: observed.lcp,
+    long_task_count: observed.longTasks.length,
+    long_task_total_ms: observed.longTasks.reduce((sum, task) => sum + task.duration, 0),
+    resource_count: performance.getEntriesByType('resource').length,
+};
+"""
+
+# CDP counters are cumulative for the tab, so these are reported per visit as deltas
+CUMULATIVE_METRICS = {
+    "LayoutCount": "layout_count",
+    "RecalcStyleCount": "recalc_style_count",
+    "ScriptDuration": "script_duration_ms",
+    "LayoutDuration": "layout_duration_ms",
+    "TaskDuration": "task_duration_ms",
+}
+
+
+def install_perf_observers(driver):
+    """Start LCP/long-task observers in every new document and enable CDP metrics"""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_JS})
+    driver.execute_cdp_cmd("Performance.enable", {"timeDomain": "timeTicks"})
+
+
+def cdp_metrics(driver):
+    """Performance.getMetrics as a {name: value} dict"""
+    result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    return {metric["name"]: metric["value"] for metric in result.get("metrics", [])}
+
+
+class PerfRecorder:
+    """Collect metrics for each page before the browser navigates away from it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.visits = []
+        self._previous = {}
+        self._get = driver.get
+        self._refresh = driver.refresh
+        driver.get = self.get
+        driver.refresh = self.refresh
+
+    def reset(self):
+        """Forget recorded visits (a new test, or a fresh tab from the pool)"""
+        self.visits = []
+        self._previous = {}
+
+    def collect(self):
+        """Metrics for the current page, or None for about:blank/data: pages"""
+        try:
+            metrics = self.driver.execute_script(COLLECT_JS)
+            if metrics is None:
+                return None
+            counters = cdp_metrics(self.driver)
+        except Exception as e:
+            print(f"⚠️  Could not collect performance metrics: {e}")
+            return None
+
+        for name, key in CUMULATIVE_METRICS.items():
+            value = counters.get(name, 0) - self._previous.get(name, 0)
+            # Durations come back in seconds
+            metrics[key] = round(value * 1000, 1) if key.endswith("_ms") else value
+        metrics["js_heap_mb"] = round(counters.get("JSHeapUsedSize", 0) / 2**20, 2)
+        metrics["dom_nodes"] = counters.get("Nodes")
+        self._previous = counters
+        return metrics
+
+    def record(self):
+        """Collect the current page into visits; returns its metrics so far"""
+        metrics = self.collect()
+        if not metrics:
+            return None
+        last = self.visits[-1] if self.visits else None
+        if last and last.get("time_origin") == metrics["time_origin"]:
+            # Same document recorded again (by the test, then by flush): fold the new deltas in
+            for key in CUMULATIVE_METRICS.values():
+                metrics[key] = round(last[key] + metrics[key], 1)
+            self.visits[-1] = metrics
+        else:
+            self.visits.append(metrics)
+        return metrics
+
+    def get(self, url):
+        self.record()
+        return self._get(url)
+
+    def refresh(self):
+        self.record()
+        return self._refresh()
+
+    def flush(self):
+        """Record the page still open and return every visit so far"""
+        self.record()
+        return self.visits
+
+
+def load_budgets(path=BUDGETS_PATH):
+    """Per-route budgets: {"default": {...}, "/route": {...}}"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def budgets_for(route, budgets):
+    """The default budget overlaid with the route's own"""
+    return {**budgets.get("default", {}), **budgets.get(route, {})}
+
+
+def check_budgets(metrics, budgets):
+    """List of 'route metric value > budget' violations for one visit"""
+    violations = []
+    for key, limit in budgets_for(metrics["route"], budgets).items():
+        value = metrics.get(key)
+        if value is not None and value > limit:
+            violations.append(f"{metrics['route']} {key}: {value:.1f} > {limit}")
+    return violations
+
+
+def format_metrics(metrics):
+    """One-line summary for test output"""
+    def _fmt(key, unit="ms"):
+        value = metrics.get(key)
+        return f"{key.replace('_ms', '')}={value:.0f}{unit}" if value is not None else f"{key}=n/a"
+
+    return " ".join([
+        metrics["route"],
+        _fmt("ttfb_ms"), _fmt("fcp_ms"), _fmt("lcp_ms"), _fmt("dom_content_loaded_ms"),
+        f"long_tasks={metrics['long_task_count']} ({metrics['long_task_total_ms']:.0f}ms)",
+        f"heap={metrics['js_heap_mb']}MB layouts={metrics['layout_count']}",
+        f"script={metrics['script_duration_ms']:.0f}ms",
+    ])
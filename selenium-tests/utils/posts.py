@@ -0,0 +1,68 @@
+"""
+Structured extraction of the rendered posts.
+
+Reads every card rendered by client/src/components/Posts/Posts.js inside
+the browser and returns id, title, message, tags, likeCount and creator as
+JSON (plus a reference to the card element), so assertions don't ship driver.page_source (with every post's inline
+base64 image) over the wire.
+
+The post object is taken from the card's React fiber (the `post` prop
+passed to Post.js); the text of the card is parsed as a fallback.
+"""
+
+from collections import namedtuple
+
+from utils.readiness import POST_CARD_SELECTOR
+
+RenderedPost = namedtuple("RenderedPost", ["id", "title", "message", "tags", "like_count", "creator", "source", "element"])
+
+POSTS_JS = """
+const [selector] = arguments;
+
+function postProp(el) {
+    // React 16 stores the fiber as __reactInternalInstance$<key>, React 17+ as __reactFiber$<key>
+    const key = Object.keys(el).find(
+        (k) => k.startsWith('__reactInternalInstance$') || k.startsWith('__reactFiber$'));
+    let fiber = key && el[key];
+    for (let depth = 0; fiber && depth < 15; depth++, fiber = fiber.return) {
+        const props = fiber.memoizedProps;
+        if (props && props.post && props.post._id) return props.post;
+    }
+    return null;
+}
+
+function text(el, query) {
+    const node = el.querySelector(query);
+    return node ? node.textContent.trim() : null;
+}
+
+return Array.from(document.querySelectorAll(selector)).map((card) => {
+    const post = postProp(card);
+    if (post) {
+        return [post._id, post.title, post.message, post.tags || [], post.likeCount, post.creator, 'fiber', card];
+    }
+    const tags = (text(card, 'h2.MuiTypography-body2') || '')
+        .split(/\\s+/).filter((t) => t.startsWith('#')).map((t) => t.slice(1));
+    const like = (card.innerText.match(/Like\\s+(\\d+)/) || [])[1];
+    return [
+        null,
+        text(card, '.MuiTypography-h5'),
+        text(card, '.MuiCardContent-root p'),
+        tags,
+        like === undefined ? null : Number(like),
+        text(card, '.MuiTypography-h6'),
+        'dom',
+        card,
+    ];
+});
+"""
+
+
+def rendered_posts(driver, selector=POST_CARD_SELECTOR):
+    """Every rendered post card as a RenderedPost, in page order"""
+    return [RenderedPost(*row) for row in driver.execute_script(POSTS_JS, selector) or []]
+
+
+def posts_by_title(driver, selector=POST_CARD_SELECTOR):
+    """Rendered posts indexed by title (the last card wins on duplicates)"""
+    return {post.title: post for post in rendered_posts(driver, selector)}
@@ -0,0 +1,162 @@
+"""
+Readiness waits for the Memories app.
+
+Event-driven replacements for fixed time.sleep calls: each helper polls a
+cheap in-page condition with WebDriverWait and returns as soon as it holds.
+Helpers return a falsy value on timeout instead of raising, so callers can
+decide whether a missed condition is a failure.
+"""
+
+import os
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.locators import find_first
+
+DEFAULT_TIMEOUT = float(os.getenv("WAIT_TIMEOUT", "15"))
+POLL_INTERVAL = float(os.getenv("WAIT_POLL_INTERVAL", "0.1"))
+
+POST_CARD_SELECTOR = ".MuiCard-root"
+# App.js's posts column (<Grid item xs={12} sm={7}>): the cards grid, or the spinner while empty
+POSTS_GRID_SELECTOR = ".MuiGrid-container > .MuiGrid-grid-sm-7"
+
+# Locates the Redux store through the <Provider> fiber under the React root
+STORE_JS = """
+function findStore() {
+    const root = document.getElementById('root');
+    const container = root && root._reactRootContainer;
+    let fiber = container && (container._internalRoot || container).current;
+    while (fiber) {
+        const props = fiber.memoizedProps;
+        if (props && props.store && typeof props.store.getState === 'function') return props.store;
+        fiber = fiber.child;
+    }
+    return null;
+}
+"""
+
+POSTS_STATE_JS = """
+const cards = document.querySelectorAll(arguments[0]).length;
+const fetched = performance.getEntriesByType('resource')
+    .some((entry) => /\\/posts(\\?|$)/.test(entry.name));
+return {cards: cards, fetched: fetched};
+"""
+
+STORE_SNAPSHOT_JS = STORE_JS + """
+const store = findStore();
+if (!store) {
+    // Fall back to the rendered cards when the store cannot be reached
+    return Array.from(document.querySelectorAll(arguments[0])).map((c) => c.innerText).join('\\n');
+}
+const posts = store.getState().posts || [];
+return JSON.stringify(posts.map((p) => [p._id, p.title, p.message, p.tags, p.likeCount]));
+"""
+
+# Uses the injected fetch/XHR counter (utils.network) when it is present
+NETWORK_STATE_JS = """
+const tracker = window.__netTracker;
+if (tracker) {
+    return [document.readyState, tracker.pending, Date.now() - tracker.lastActivity, true];
+}
+return [document.readyState, performance.getEntriesByType('resource').length, null, false];
+"""
+
+VISIBLE_COUNT_JS = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .filter((el) => el.getClientRects().length > 0).length;
+"""
+
+
+def wait_until(driver, condition, timeout=None, poll=None, description="condition"):
+    """Poll condition(driver) until it returns a truthy value; False on timeout"""
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+    poll = POLL_INTERVAL if poll is None else poll
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll,
+            ignored_exceptions=(WebDriverException,)
+        ).until(condition)
+    except TimeoutException:
+        print(f"⚠️  Timed out after {timeout}s waiting for {description}")
+        return False
+
+
+def wait_for_posts_rendered(driver, timeout=None, poll=None):
+    """
+    Wait until the posts list has rendered.
+
+    Returns the number of post cards, or True when the /posts fetch finished
+    with nothing to show (Posts.js keeps a spinner for an empty list).
+    """
+    def _rendered(d):
+        state = d.execute_script(POSTS_STATE_JS, POST_CARD_SELECTOR)
+        if state["cards"]:
+            return state["cards"]
+        return state["fetched"]
+
+    return wait_until(driver, _rendered, timeout, poll, "posts list to render")
+
+
+def wait_for_network_idle(driver, quiet_ms=300, timeout=None, poll=None):
+    """
+    Wait until the document is loaded and the network has been quiet for quiet_ms.
+
+    With the in-page tracker installed this means no pending fetch/XHR
+    requests; otherwise no new resource timing entries.
+    """
+    state = {"count": None, "since": time.monotonic()}
+
+    def _idle(d):
+        ready, count, quiet_for, tracked = d.execute_script(NETWORK_STATE_JS)
+        if tracked:
+            return ready == "complete" and count == 0 and quiet_for >= quiet_ms
+
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return ready == "complete" and (now - state["since"]) * 1000 >= quiet_ms
+
+    return wait_until(driver, _idle, timeout, poll, "network idle")
+
+
+def store_snapshot(driver):
+    """Return a comparable signature of the Redux posts state"""
+    return driver.execute_script(STORE_SNAPSHOT_JS, POST_CARD_SELECTOR)
+
+
+def wait_for_store_update(driver, previous, timeout=None, poll=None):
+    """Wait until the Redux posts state differs from a store_snapshot() result"""
+    def _changed(d):
+        current = store_snapshot(d)
+        return current if current != previous else False
+
+    return wait_until(driver, _changed, timeout, poll, "Redux store update")
+
+
+def count_visible(driver, selector=POST_CARD_SELECTOR):
+    """Count rendered elements matching a CSS selector in one round trip"""
+    return driver.execute_script(VISIBLE_COUNT_JS, selector)
+
+
+def wait_for_count_change(driver, previous, selector=POST_CARD_SELECTOR, timeout=None, poll=None):
+    """Wait until the number of visible matches differs from previous; returns the new count"""
+    def _changed(d):
+        count = count_visible(d, selector)
+        # A count of zero is a valid result, so wrap it to stay truthy
+        return (count,) if count != previous else False
+
+    result = wait_until(driver, _changed, timeout, poll, f"count of '{selector}' to change")
+    return result[0] if result else None
+
+
+def wait_for_element(driver, candidates, timeout=None, poll=None, **kwargs):
+    """Wait until one of the candidate selectors matches (see find_first)"""
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+    poll = POLL_INTERVAL if poll is None else poll
+    match = find_first(driver, candidates, timeout=timeout, poll_frequency=poll, **kwargs)
+    if not match:
+        print(f"⚠️  Timed out after {timeout}s waiting for element")
+    return match
@@ -0,0 +1,123 @@
+"""
+Asynchronous screenshot pipeline.
+
+Only grabbing the PNG bytes from the browser happens on the test thread;
+decoding, downscaling, WebP/JPEG encoding and the disk write run on a
+background thread pool. Which shots are taken at all is controlled by
+SCREENSHOTS:
+
+    failure      only when a test fails (default)
+    checkpoints  failures plus the names listed in SCREENSHOT_CHECKPOINTS
+    all          every take_screenshot call plus failures
+    off          nothing
+"""
+
+import io
+import itertools
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:  # Without Pillow shots are written as the browser's PNG
+    Image = None
+
+from utils.workers import worker_name
+
+SCREENSHOT_DIR = os.getenv("SCREENSHOT_DIR", "screenshots")
+MODE = os.getenv("SCREENSHOTS", "failure").lower()
+CHECKPOINTS = {name.strip() for name in os.getenv("SCREENSHOT_CHECKPOINTS", "").split(",") if name.strip()}
+FORMAT = os.getenv("SCREENSHOT_FORMAT", "webp").lower()
+SCALE = float(os.getenv("SCREENSHOT_SCALE", "0.5"))
+QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "70"))
+
+EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg", "PNG": "png"}
+
+
+def output_format(fmt=FORMAT):
+    """Pillow format name actually used ('PNG' when Pillow is missing)"""
+    if Image is None:
+        return "PNG"
+    return {"jpg": "JPEG"}.get(fmt, fmt.upper())
+
+
+def encode(png, fmt=FORMAT, scale=SCALE, quality=QUALITY):
+    """Re-encode the browser's PNG bytes, downscaled by `scale`"""
+    fmt = output_format(fmt)
+    if Image is None or fmt == "PNG" and scale == 1:
+        return png
+    image = Image.open(io.BytesIO(png))
+    if scale != 1:
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        image = image.resize(size, Image.LANCZOS)
+    if fmt == "WEBP":
+        options = {"quality": quality, "method": 4}
+    elif fmt == "JPEG":
+        image = image.convert("RGB")
+        options = {"quality": quality, "optimize": True}
+    else:
+        options = {"optimize": True}
+    out = io.BytesIO()
+    image.save(out, format=fmt, **options)
+    return out.getvalue()
+
+
+class ScreenshotService:
+    """Capture on the test thread, encode and write in the background"""
+
+    def __init__(self, directory=SCREENSHOT_DIR, mode=MODE, checkpoints=CHECKPOINTS,
+                 fmt=FORMAT, scale=SCALE, quality=QUALITY, workers=2):
+        self.directory = directory
+        self.mode = mode
+        self.checkpoints = checkpoints
+        self.fmt = fmt
+        self.scale = scale
+        self.quality = quality
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+        self.pending = []
+        self.extension = EXTENSIONS[output_format(fmt)]
+        self._counter = itertools.count(1)
+
+    def wanted(self, name, failure=False):
+        """Whether the current mode captures this shot"""
+        if self.mode == "off":
+            return False
+        if failure or self.mode == "all":
+            return True
+        return self.mode == "checkpoints" and name in self.checkpoints
+
+    def _path(self, name):
+        # Worker, millisecond timestamp and a per-process sequence number keep names unique
+        safe = re.sub(r"[^\w.-]+", "_", name)
+        stamp = time.strftime("%Y%m%d_%H%M%S") + f"{time.time() % 1:.3f}"[1:]
+        filename = f"{safe}_{worker_name()}_{stamp}_{next(self._counter):04d}.{self.extension}"
+        return os.path.join(self.directory, filename)
+
+    def _write(self, png, path):
+        data = encode(png, self.fmt, self.scale, self.quality)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def capture(self, driver, name, failure=False):
+        """Grab the screen if wanted and queue the write; returns the file path, or None"""
+        if not self.wanted(name, failure):
+            return None
+        png = driver.get_screenshot_as_png()
+        path = self._path(name)
+        self.pending.append(self.executor.submit(self._write, png, path))
+        return path
+
+    def close(self):
+        """Wait for queued writes; returns the paths written"""
+        self.executor.shutdown(wait=True)
+        written = []
+        for future in self.pending:
+            try:
+                written.append(future.result())
+            except Exception as e:
+                print(f"⚠️  Screenshot could not be written: {e}")
+        return written
@@ -0,0 +1,46 @@
+"""
+Files that several processes update.
+
+pytest-xdist workers save the same recording and locator cache at the end
+of their sessions. Each save is a read-merge-write, so it runs under an
+exclusive lock on <path>.lock, and the new content is written to a temp
+file and moved into place with os.replace, so readers never see half a file.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def locked(path):
+    """Hold an exclusive lock for path (blocks until other holders release it)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(f"{path}.lock", "a+") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def write_json_atomic(path, data, **kwargs):
+    """json.dump to a temp file next to path, then replace path with it"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, **kwargs)
+    os.replace(tmp_path, path)
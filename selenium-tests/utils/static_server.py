@@ -0,0 +1,51 @@
+"""
+Static server for the production build of client/.
+
+Serves `npm run build` output with an index.html fallback for client-side
+routes, which loads far faster in tests than the webpack dev server.
+Run: python -m utils.static_server <build dir> --port 3000
+"""
+
+import argparse
+import functools
+import os
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+class SPARequestHandler(SimpleHTTPRequestHandler):
+    """Serve files, falling back to index.html for unknown paths"""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.exists(path):
+            self.path = "/index.html"
+        return super().send_head()
+
+    def end_headers(self):
+        # Hashed bundles under /static never change for a given build
+        if self.path.startswith("/static/"):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} {format % args}", flush=True)
+
+
+def serve(directory, port, host="0.0.0.0"):
+    """Serve directory until interrupted"""
+    handler = functools.partial(SPARequestHandler, directory=directory)
+    with ThreadingHTTPServer((host, port), handler) as server:
+        print(f"Serving {directory} on http://{host}:{port}", flush=True)
+        server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Memories production build")
+    parser.add_argument("directory")
+    parser.add_argument("--port", type=int, default=3000)
+    args = parser.parse_args()
+    serve(args.directory, args.port)
+
+
+if __name__ == "__main__":
+    main()
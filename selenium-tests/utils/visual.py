@@ -0,0 +1,190 @@
+"""
+Visual regression checks against golden screenshots.
+
+Each capture is split into 32px tiles and every tile gets a difference
+hash (dHash) from a single downscale of the whole image. Only tiles whose
+hashes differ from the golden image are compared pixel by pixel with
+NumPy, so an unchanged page costs one resize and one array comparison.
+Regions listed as masks (data-dependent content such as the posts grid)
+are blanked in both images before comparing. The mask rectangles of the
+golden capture are stored next to it and applied as well, so content that
+moved or resized since the golden was taken is ignored on both sides.
+
+Goldens live in visual/golden/<test>_<name>_<width>x<height>_<browser><major>_<platform>.png
+(masks in .masks.json), since another Chrome or another OS's fonts render
+differently. A missing golden fails the check and leaves the capture in
+test-results/visual/ for review; goldens are only written with
+VISUAL_UPDATE=true.
+"""
+
+import io
+import json
+import os
+import time
+from collections import namedtuple
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # Visual checks are skipped without numpy/Pillow
+    np = Image = None
+
+SUITE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GOLDEN_DIR = os.getenv("VISUAL_GOLDEN_DIR", os.path.join(SUITE_DIR, "visual", "golden"))
+OUTPUT_DIR = os.getenv("VISUAL_OUTPUT_DIR", os.path.join("test-results", "visual"))
+UPDATE = os.getenv("VISUAL_UPDATE", "false").lower() == "true"
+TILE = 32
+PIXEL_TOLERANCE = int(os.getenv("VISUAL_PIXEL_TOLERANCE", "24"))  # per channel, 0-255
+MAX_DIFF_RATIO = float(os.getenv("VISUAL_MAX_DIFF", "0.002"))  # share of pixels allowed to differ
+
+VisualResult = namedtuple(
+    "VisualResult", ["passed", "name", "diff_ratio", "changed_tiles", "seconds", "diff_path", "message"]
+)
+
+MASK_RECTS_JS = """
+const rects = [];
+for (const selector of arguments[0]) {
+    for (const el of document.querySelectorAll(selector)) {
+        const r = el.getBoundingClientRect();
+        if (r.width && r.height) rects.push([r.left, r.top, r.width, r.height]);
+    }
+}
+return {rects: rects, ratio: window.devicePixelRatio || 1};
+"""
+
+
+def available():
+    return np is not None
+
+
+def load(png):
+    """PNG bytes or path -> HxWx3 uint8 array"""
+    source = io.BytesIO(png) if isinstance(png, bytes) else png
+    return np.asarray(Image.open(source).convert("RGB"))
+
+
+def apply_masks(pixels, rects):
+    """Blank out (x, y, w, h) device-pixel rectangles"""
+    if not rects:
+        return pixels
+    pixels = pixels.copy()
+    for x, y, w, h in rects:
+        pixels[max(0, int(y)):max(0, int(y + h)), max(0, int(x)):max(0, int(x + w))] = 0
+    return pixels
+
+
+def load_masks(golden_path):
+    """Mask rectangles saved with a golden image, or [] for older goldens"""
+    try:
+        with open(golden_path[:-len(".png")] + ".masks.json") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_golden(golden_path, pixels, rects):
+    Image.fromarray(pixels).save(golden_path)
+    with open(golden_path[:-len(".png")] + ".masks.json", "w") as f:
+        json.dump([[round(value, 1) for value in rect] for rect in rects], f)
+
+
+def tile_hashes(pixels, tile=TILE):
+    """dHash bits (rows, cols, 8, 8) and mean brightness (rows, cols) per tile"""
+    rows, cols = -(-pixels.shape[0] // tile), -(-pixels.shape[1] // tile)
+    padded = np.zeros((rows * tile, cols * tile, 3), dtype=np.uint8)
+    padded[:pixels.shape[0], :pixels.shape[1]] = pixels
+    # One box downscale gives every tile a 9x8 grayscale thumbnail
+    small = Image.fromarray(padded).convert("L").resize((cols * 9, rows * 8), Image.BOX)
+    thumbs = np.asarray(small, dtype=np.int16).reshape(rows, 8, cols, 9).transpose(0, 2, 1, 3)
+    return thumbs[..., 1:] > thumbs[..., :-1], thumbs.mean(axis=(2, 3))
+
+
+def changed_tiles(actual, golden, tile=TILE):
+    """Boolean (rows, cols) map of tiles whose hashes differ"""
+    bits_a, mean_a = tile_hashes(actual, tile)
+    bits_g, mean_g = tile_hashes(golden, tile)
+    # dHash only sees gradients, so flat tiles that change colour are caught by their mean
+    return (bits_a != bits_g).any(axis=(2, 3)) | (np.abs(mean_a - mean_g) > 2)
+
+
+def pixel_diff(actual, golden, tiles, tile=TILE, tolerance=PIXEL_TOLERANCE):
+    """Boolean HxW map of differing pixels, computed only inside the changed tiles"""
+    diff = np.zeros(actual.shape[:2], dtype=bool)
+    for row, col in zip(*np.nonzero(tiles)):
+        ys, xs = slice(row * tile, (row + 1) * tile), slice(col * tile, (col + 1) * tile)
+        delta = np.abs(actual[ys, xs].astype(np.int16) - golden[ys, xs].astype(np.int16))
+        diff[ys, xs] = delta.max(axis=2) > tolerance
+    return diff
+
+
+def diff_image(golden, diff):
+    """Dimmed golden image with differing pixels in red"""
+    out = (golden * 0.35 + 160).astype(np.uint8)
+    out[diff] = (255, 0, 0)
+    return Image.fromarray(out)
+
+
+def compare(png, name, rects=(), golden_dir=GOLDEN_DIR, output_dir=OUTPUT_DIR, update=UPDATE,
+            max_ratio=MAX_DIFF_RATIO):
+    """Compare a capture with its golden image; returns a VisualResult"""
+    start = time.perf_counter()
+    golden_path = os.path.join(golden_dir, f"{name}.png")
+    actual_path = os.path.join(output_dir, f"{name}_actual.png")
+
+    if update:
+        os.makedirs(golden_dir, exist_ok=True)
+        save_golden(golden_path, apply_masks(load(png), rects), rects)
+        return VisualResult(True, name, 0.0, 0, time.perf_counter() - start, None, f"{name}: golden updated")
+
+    if not os.path.exists(golden_path):
+        # Never seeded implicitly: a golden made on the wrong machine would pass everything after it
+        os.makedirs(output_dir, exist_ok=True)
+        Image.fromarray(apply_masks(load(png), rects)).save(actual_path)
+        return VisualResult(
+            False, name, None, None, time.perf_counter() - start, actual_path,
+            f"{name}: no golden at {golden_path}; review {actual_path} and seed it with VISUAL_UPDATE=true"
+        )
+
+    # Both mask sets apply to both images, so dynamic content is ignored where it is now and where it was
+    rects = list(rects) + load_masks(golden_path)
+    actual = apply_masks(load(png), rects)
+    golden = apply_masks(load(golden_path), rects)
+    os.makedirs(output_dir, exist_ok=True)
+
+    if actual.shape != golden.shape:
+        Image.fromarray(actual).save(actual_path)
+        return VisualResult(
+            False, name, 1.0, None, time.perf_counter() - start, actual_path,
+            f"{name}: size {actual.shape[1]}x{actual.shape[0]} != golden {golden.shape[1]}x{golden.shape[0]}"
+        )
+
+    tiles = changed_tiles(actual, golden)
+    if not tiles.any():
+        return VisualResult(True, name, 0.0, 0, time.perf_counter() - start, None, f"{name}: identical hashes")
+
+    diff = pixel_diff(actual, golden, tiles)
+    ratio = float(diff.mean())
+    diff_path = None
+    if diff.any():
+        diff_path = os.path.join(output_dir, f"{name}_diff.png")
+        diff_image(golden, diff).save(diff_path)
+        Image.fromarray(actual).save(actual_path)
+    passed = ratio <= max_ratio
+    return VisualResult(
+        passed, name, ratio, int(tiles.sum()), time.perf_counter() - start, diff_path,
+        f"{name}: {ratio:.3%} of pixels differ in {int(tiles.sum())} tiles (limit {max_ratio:.3%})"
+    )
+
+
+def check_page(driver, name, mask=()):
+    """Screenshot the viewport, blank the masked selectors and compare with the golden"""
+    size = driver.execute_script("return [window.innerWidth, window.innerHeight];")
+    caps = driver.capabilities
+    browser = f"{caps.get('browserName', 'browser')}{str(caps.get('browserVersion', '')).split('.')[0]}"
+    platform = str(caps.get("platformName", "any")).lower()
+    key = f"{name}_{size[0]}x{size[1]}_{browser}_{platform}"
+    if not available():
+        return VisualResult(True, key, None, None, 0.0, None, f"{key}: skipped (needs numpy and Pillow)")
+    masks = driver.execute_script(MASK_RECTS_JS, list(mask))
+    rects = [[value * masks["ratio"] for value in rect] for rect in masks["rects"]]
+    return compare(driver.get_screenshot_as_png(), key, rects)
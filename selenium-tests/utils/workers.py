@@ -0,0 +1,41 @@
+"""
+Worker identity for parallel runs.
+
+Under pytest-xdist every worker is its own process with its own Chrome, so
+anything that must not collide (debugging ports, profile dirs, test data)
+is namespaced with the worker name and the shared run id.
+"""
+
+import os
+import socket
+import time
+
+
+def worker_name():
+    """xdist worker name (gw0, gw1, ...) or 'main' for a serial run"""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def run_id():
+    """Identifier shared by all workers of one run"""
+    if not os.getenv("TEST_RUN_ID"):
+        # Set once so xdist workers (spawned later) inherit the same value
+        os.environ["TEST_RUN_ID"] = time.strftime("%Y%m%d%H%M%S")
+    return os.environ["TEST_RUN_ID"]
+
+
+def namespace():
+    """Per-worker data namespace, e.g. '20240101120000-gw1'"""
+    return f"{run_id()}-{worker_name()}"
+
+
+def is_controller(config):
+    """True in the xdist controller process (or in a serial run)"""
+    return not hasattr(config, "workerinput")
+
+
+def free_port():
+    """Ask the OS for a currently unused TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]